@@ -13,7 +13,15 @@ from config.config import config
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = config.DATABASE_URL
-engine = create_engine("postgresql+psycopg://" + DATABASE_URL, echo=True, future=True)
+engine = create_engine(
+    "postgresql+psycopg://" + DATABASE_URL,
+    echo=True,
+    future=True,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+)
 sync_connection = psycopg.connect(conninfo="postgresql://" + DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
@@ -352,6 +352,13 @@ class GraphExecutionRepository:
         self.db.refresh(db_node_execution)
         return db_node_execution
 
+    def bulk_create_node_executions(
+        self, node_executions: List[Dict[str, Any]]
+    ) -> None:
+        """Create several node executions in a single round-trip."""
+        self.db.bulk_insert_mappings(NodeExecution, node_executions)
+        self.db.commit()
+
     def get_node_execution_by_id(
         self, node_execution_id: uuid.UUID
     ) -> Optional[NodeExecution]:
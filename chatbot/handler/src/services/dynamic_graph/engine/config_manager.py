@@ -32,8 +32,12 @@ class ToolNodeConfig(BaseModel):
 
     timeout_seconds: int = 300
     retry_attempts: int = 3
+    max_backoff_seconds: int = 30
     parallel_execution: bool = False
+    max_concurrency: int = 8  # concurrent tool calls when parallel_execution is on
     continue_on_error: bool = True
+    memoize_tools: List[str] = []  # idempotent tools whose results may be reused
+    memo_ttl_seconds: int = 300  # how long a memoized result may be reused
 
 
 class ConditionNodeConfig(BaseModel):
@@ -121,6 +125,21 @@ class ConfigManager:
         node_tools = self.tool_repo.get_tools_by_node(node.id)
         return [node_tool.tool for node_tool in node_tools if node_tool.is_enabled]
 
+    def get_tools_version(self, tools: List[AvailableTool]) -> tuple:
+        """
+        Get a version marker for a node's tools.
+
+        The marker changes whenever a tool is added, removed or updated, so
+        callers can keep derived objects until it does.
+
+        Args:
+            tools: Tools returned by get_node_tools
+
+        Returns:
+            tuple: Tool ids and update timestamps
+        """
+        return tuple((tool.id, tool.updated_at) for tool in tools)
+
     def validate_graph_structure(
         self, nodes: List[GraphNode], edges: List[GraphEdge]
     ) -> tuple[bool, List[str]]:
@@ -11,10 +11,37 @@ from sqlalchemy.orm import Session
 
 from .graph_builder import DynamicGraphBuilder
 from .state_manager import DynamicStateManager, DynamicState
-from ..execution.tracker import ExecutionTracker
+from ..execution.tracker import ExecutionTracker, STATUS_COMPLETED, STATUS_FAILED
 
 logger = logging.getLogger(__name__)
 
+# Message types left out of the API response
+EXCLUDED_RESPONSE_TYPES = frozenset({"human", "system"})
+
+# Message type resolved once per concrete message class
+_message_types: Dict[type, str] = {}
+
+
+def _get_message_type(message: Any) -> str:
+    """
+    Get a message's type, resolving it once per message class.
+
+    LangChain message classes pin ``type`` to a single literal value, so
+    the first instance seen is enough to classify the whole class.
+
+    Args:
+        message: Message instance
+
+    Returns:
+        str: Message type (e.g. "ai", "human") or the class name
+    """
+    message_class = type(message)
+    msg_type = _message_types.get(message_class)
+    if msg_type is None:
+        msg_type = getattr(message, "type", message_class.__name__)
+        _message_types[message_class] = msg_type
+    return msg_type
+
 
 class DynamicGraphExecutionEngine:
     """
@@ -51,24 +78,53 @@ class DynamicGraphExecutionEngine:
         """
         execution = None
 
-        for attempt in range(self.max_retries):
-            try:
-                # 1. Start execution tracking
-                if execution is None:
-                    execution = self.tracker.start_execution(chat_id, session_id)
+        try:
+            # 1. Start execution tracking
+            execution = await asyncio.to_thread(
+                self.tracker.start_execution, chat_id, session_id
+            )
+        except Exception as e:
+            logger.error(f"Dynamic graph setup failed: {str(e)}", exc_info=True)
+            return await self._failed_result(execution, str(e), attempts=1)
 
-                # 2. Build graph from database (with caching)
-                try:
-                    graph = self.builder.build_graph_from_database()
-                except Exception as build_error:
-                    logger.error(
-                        f"Graph building failed on attempt {attempt + 1}: {build_error}"
-                    )
-                    if attempt == self.max_retries - 1:
-                        raise build_error
-                    await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
-                    continue
+        try:
+            # 2. Build graph from database (with caching) once; execution
+            # retries below reuse the compiled graph
+            graph = await self._build_graph_with_retry()
+        except Exception as e:
+            logger.error(f"Dynamic graph build failed: {str(e)}", exc_info=True)
+            # The build is only given up on after every attempt failed
+            return await self._failed_result(
+                execution, str(e), attempts=self.max_retries
+            )
+
+        try:
+            return await self._execute_with_retries(
+                graph, execution, chat_id, session_id, input_message
+            )
+        finally:
+            # Release the execution's history handle and context messages on
+            # every exit path, including cancellation
+            self.state_manager.release_execution(execution.id)
+
+    async def _execute_with_retries(
+        self, graph, execution, chat_id: str, session_id: str, input_message: str
+    ) -> Dict[str, Any]:
+        """
+        Execute a compiled graph, retrying failed or timed out attempts.
+
+        Args:
+            graph: Compiled LangGraph
+            execution: GraphExecution being tracked
+            chat_id: Chat session ID
+            session_id: Session ID
+            input_message: User input message
 
+        Returns:
+            Dict[str, Any]: Execution result including messages and node executions
+        """
+        for attempt in range(self.max_retries):
+            try:
                 # 3. Initialize state
                 state = self.state_manager.create_initial_state(
                     input_message, execution.id, session_id, chat_id=chat_id
@@ -84,40 +140,40 @@ class DynamicGraphExecutionEngine:
                     )
 
                     # 5. Save conversation history and get filtered messages (using static graph approach)
-                    context_messages = state.get("_context_messages", [])
+                    context_messages = self.state_manager.get_context_messages(state)
                     all_messages = result.get("messages", [])
 
                     # Filter messages using the same logic as static graph
-                    # This filters out context messages but keeps new user input and AI responses
-                    filtered_messages = [
-                        message
-                        for message in all_messages
-                        if message not in context_messages
-                    ]
+                    # This filters out context messages but keeps new user input and AI responses.
+                    # For API response: return only AI and tool responses (exclude user input)
+                    filtered_messages = []
+                    filtered_messages_for_response = []
+                    for message in all_messages:
+                        if message in context_messages:
+                            continue
+                        filtered_messages.append(message)
+                        # Include only AI and tool messages, exclude human and system messages
+                        if _get_message_type(message) not in EXCLUDED_RESPONSE_TYPES:
+                            filtered_messages_for_response.append(message)
 
                     # Save filtered messages to conversation history
                     self.state_manager.save_conversation_history(
                         state, filtered_messages
                     )
 
-                    # For API response: return only AI and tool responses (exclude user input)
-                    filtered_messages_for_response = []
-                    for message in filtered_messages:
-                        msg_type = getattr(message, "type", type(message).__name__)
-                        # Include only AI and tool messages, exclude human and system messages
-                        if msg_type not in ["human", "system"]:
-                            filtered_messages_for_response.append(message)
-
                     # 6. Record successful execution
-                    self.tracker.complete_execution(execution.id, "completed")
+                    await asyncio.to_thread(
+                        self.tracker.complete_execution, execution.id, STATUS_COMPLETED
+                    )
+                    node_executions = await asyncio.to_thread(
+                        self.tracker.get_node_executions, execution.id
+                    )
 
                     return {
                         "execution_id": execution.id,
                         "messages": filtered_messages_for_response,  # Return only new AI/tool responses
-                        "node_executions": self.tracker.get_node_executions(
-                            execution.id
-                        ),
-                        "status": "completed",
+                        "node_executions": node_executions,
+                        "status": STATUS_COMPLETED,
                         "attempts": attempt + 1,
                     }
 
@@ -125,17 +181,9 @@ class DynamicGraphExecutionEngine:
                     error_msg = f"Graph execution timed out after {self.timeout_seconds} seconds"
                     logger.error(error_msg)
                     if attempt == self.max_retries - 1:
-                        self.tracker.fail_execution(execution.id, error_msg)
-                        return {
-                            "execution_id": execution.id,
-                            "messages": [],
-                            "node_executions": self.tracker.get_node_executions(
-                                execution.id
-                            ),
-                            "status": "failed",
-                            "error": error_msg,
-                            "attempts": attempt + 1,
-                        }
+                        return await self._failed_result(
+                            execution, error_msg, attempts=attempt + 1
+                        )
                     await asyncio.sleep(2 * (attempt + 1))  # Exponential backoff
                     continue
 
@@ -147,20 +195,9 @@ class DynamicGraphExecutionEngine:
 
                 if attempt == self.max_retries - 1:
                     # Final attempt failed
-                    if execution:
-                        self.tracker.fail_execution(execution.id, str(e))
-                    return {
-                        "execution_id": execution.id if execution else None,
-                        "messages": [],
-                        "node_executions": (
-                            self.tracker.get_node_executions(execution.id)
-                            if execution
-                            else []
-                        ),
-                        "status": "failed",
-                        "error": str(e),
-                        "attempts": attempt + 1,
-                    }
+                    return await self._failed_result(
+                        execution, str(e), attempts=attempt + 1
+                    )
 
                 # Wait before retry with exponential backoff
                 await asyncio.sleep(1 * (attempt + 1))
@@ -170,11 +207,65 @@ class DynamicGraphExecutionEngine:
             "execution_id": execution.id if execution else None,
             "messages": [],
             "node_executions": [],
-            "status": "failed",
+            "status": STATUS_FAILED,
             "error": "Maximum retries exceeded",
             "attempts": self.max_retries,
         }
 
+    async def _build_graph_with_retry(self):
+        """
+        Build the graph from the database, retrying transient failures.
+
+        Returns:
+            Compiled LangGraph
+
+        Raises:
+            Exception: The last build error, once all max_retries attempts failed
+        """
+        for attempt in range(self.max_retries):
+            try:
+                return self.builder.build_graph_from_database()
+            except Exception as build_error:
+                logger.error(
+                    f"Graph building failed on attempt {attempt + 1}: {build_error}"
+                )
+                if attempt == self.max_retries - 1:
+                    raise
+                await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
+
+    async def _failed_result(
+        self, execution, error_msg: str, attempts: int
+    ) -> Dict[str, Any]:
+        """
+        Record a failed execution and build the failure response.
+
+        Args:
+            execution: GraphExecution being tracked, if one was started
+            error_msg: Error message to record
+            attempts: Number of execution attempts made
+
+        Returns:
+            Dict[str, Any]: Failed execution result
+        """
+        node_executions = []
+        if execution:
+            self.state_manager.release_execution(execution.id)
+            await asyncio.to_thread(
+                self.tracker.fail_execution, execution.id, error_msg
+            )
+            node_executions = await asyncio.to_thread(
+                self.tracker.get_node_executions, execution.id
+            )
+
+        return {
+            "execution_id": execution.id if execution else None,
+            "messages": [],
+            "node_executions": node_executions,
+            "status": STATUS_FAILED,
+            "error": error_msg,
+            "attempts": attempts,
+        }
+
     async def _execute_with_node_tracking(
         self, graph, state: DynamicState, execution_id, session_id: str
     ) -> Dict[str, Any]:
@@ -5,6 +5,7 @@ Builds a LangGraph StateGraph from database nodes, edges, and handlers.
 """
 
 import logging
+from typing import Any, Callable, Dict, Tuple
 from langgraph.graph import StateGraph, END, START
 from sqlalchemy.orm import Session
 
@@ -17,12 +18,18 @@ from .graph_cache import GraphCache
 
 logger = logging.getLogger(__name__)
 
+# Condition maps up to this size get a generated if/elif router
+MAX_SPECIALIZED_CONDITIONS = 8
+
 
 class DynamicGraphBuilder:
     """
     Builds a LangGraph StateGraph from database configuration.
     """
 
+    # Condition routers shared by edges with the same mapping
+    _router_cache: Dict[Tuple[frozenset, Any], Callable] = {}
+
     def __init__(self, db_session: Session, execution_tracker=None):
         self.db = db_session
         self.graph_repo = GraphRepository(db_session)
@@ -40,9 +47,7 @@ class DynamicGraphBuilder:
         edges = self.graph_repo.get_all_edges()
 
         # Check cache first
-        nodes_hash = self.cache.get_nodes_hash(nodes)
-        edges_hash = self.cache.get_edges_hash(edges)
-        cache_key = self.cache.get_cache_key("default", nodes_hash, edges_hash)
+        cache_key = self._get_cache_key(nodes, edges)
 
         cached_graph = self.cache.get(cache_key)
         if cached_graph:
@@ -61,6 +66,18 @@ class DynamicGraphBuilder:
         # Identify start nodes first to determine which nodes to skip
         start_nodes = [node for node in nodes if node.node_type == "start"]
 
+        # Resolve each distinct node type's handler once
+        handlers = {
+            node_type: self.node_handlers.get_handler(node_type)
+            for node_type in {node.node_type for node in nodes}
+            if node_type != "start"
+        }
+        for node_type, handler in handlers.items():
+            if not handler:
+                logger.warning(
+                    f"No handler for node type: {node_type}, skipping its nodes"
+                )
+
         # Add nodes (skip start nodes since we'll bypass them)
         for node in nodes:
             # Skip start nodes - we'll create direct edge from START
@@ -70,10 +87,10 @@ class DynamicGraphBuilder:
                 )
                 continue
 
-            handler = self.node_handlers.get_handler(node.node_type)
+            handler = handlers[node.node_type]
             if not handler:
-                logger.warning(
-                    f"No handler for node type: {node.node_type}, skipping node {node.node_id}"
+                logger.debug(
+                    f"Skipping node {node.node_id} of unsupported type {node.node_type}"
                 )
                 continue
             workflow.add_node(node.node_id, handler.create_handler(node))
@@ -98,17 +115,9 @@ class DynamicGraphBuilder:
                     conditions = edge.condition_config.get("conditions", {})
                     default_node = edge.condition_config.get("default", END)
 
-                    # Create condition function with proper closure - fix the closure issue
-                    def create_condition_func(conditions_map, default_target):
-                        def condition_router(state):
-                            condition_key = state.get("condition_result", "default")
-                            return conditions_map.get(condition_key, default_target)
-
-                        return condition_router
-
                     workflow.add_conditional_edges(
                         edge.from_node_id,
-                        create_condition_func(conditions, default_node),
+                        self._make_condition_router(conditions, default_node),
                         list(conditions.values())
                         + [default_node],  # All possible destinations
                     )
@@ -205,3 +214,72 @@ class DynamicGraphBuilder:
         self.cache.put(cache_key, compiled_graph)
 
         return compiled_graph
+
+    def _get_cache_key(self, nodes: list, edges: list) -> str:
+        """
+        Generate the graph cache key for a set of nodes and edges.
+
+        Args:
+            nodes: List of graph nodes
+            edges: List of graph edges
+
+        Returns:
+            str: Cache key
+        """
+        nodes_hash = self.cache.get_nodes_hash(nodes)
+        edges_hash = self.cache.get_edges_hash(edges)
+        return self.cache.get_cache_key("default", nodes_hash, edges_hash)
+
+    @classmethod
+    def _make_condition_router(
+        cls, conditions_map: Dict[str, Any], default_target: Any
+    ) -> Callable:
+        """
+        Create the routing function for a conditional edge.
+
+        Small condition maps are compiled into a dedicated if/elif function
+        so routing avoids the dict lookup on every graph step. Condition
+        keys and targets are bound through the function's globals and are
+        never interpolated into the generated source.
+
+        Args:
+            conditions_map: Mapping of condition_result values to target nodes
+            default_target: Target node when no condition matches
+
+        Returns:
+            Callable: Router taking the graph state and returning a target node
+        """
+        try:
+            cache_key = (frozenset(conditions_map.items()), default_target)
+        except TypeError:
+            cache_key = None
+
+        if cache_key is not None and cache_key in cls._router_cache:
+            return cls._router_cache[cache_key]
+
+        if len(conditions_map) <= MAX_SPECIALIZED_CONDITIONS:
+            namespace = {"_default": default_target}
+            lines = [
+                "def condition_router(state):",
+                "    condition_key = state.get('condition_result', 'default')",
+            ]
+            for index, (condition, target) in enumerate(conditions_map.items()):
+                namespace[f"_key_{index}"] = condition
+                namespace[f"_target_{index}"] = target
+                lines.append(f"    if condition_key == _key_{index}:")
+                lines.append(f"        return _target_{index}")
+            lines.append("    return _default")
+
+            exec(compile("\n".join(lines), "<condition_router>", "exec"), namespace)
+            condition_router = namespace["condition_router"]
+        else:
+            lookup = conditions_map.get
+
+            def condition_router(state):
+                condition_key = state.get("condition_result", "default")
+                return lookup(condition_key, default_target)
+
+        if cache_key is not None:
+            cls._router_cache[cache_key] = condition_router
+
+        return condition_router
@@ -5,13 +5,34 @@ Caches compiled graphs to improve performance by avoiding rebuilding on every ex
 """
 
 import logging
-import hashlib
-from typing import Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from threading import Lock
+from time import monotonic_ns
+import orjson
+import xxhash
 
 logger = logging.getLogger(__name__)
 
+# Separators between fields of a row and between rows in hash input
+FIELD_SEPARATOR = b"\x1f"
+ROW_SEPARATOR = b"\x1e"
+
+# Number of independently locked cache shards (must be a power of two)
+NUM_SHARDS = 16
+
+# Maximum number of serialized node and edge rows kept per process
+MAX_ROW_DATA = 4096
+
+# Serialized rows keyed by (model name, row id, updated_at). Caches are
+# created per request, so this lives at module level to be reused.
+_row_data: OrderedDict[Tuple[str, Any, Any], bytes] = OrderedDict()
+_row_data_lock = Lock()
+
+# Last computed hash per row kind, with the version hash it was built from.
+# Holds one entry per kind ("nodes", "edges").
+_hashes: Dict[str, Tuple[str, str]] = {}
+
 
 class GraphCache:
     """
@@ -22,14 +43,28 @@ class GraphCache:
         """
         Initialize graph cache.
 
+        Entries are spread over up to NUM_SHARDS shards, each with its own
+        lock, so lookups of unrelated keys never wait on each other. Every
+        shard holds the same number of entries, so the cache holds at most
+        max_size graphs; the actual capacity is max_size rounded down to a
+        multiple of the shard count.
+
         Args:
             ttl_minutes: Time to live for cached graphs in minutes
             max_size: Maximum number of graphs to cache
         """
-        self.ttl = timedelta(minutes=ttl_minutes)
+        self.ttl_minutes = ttl_minutes
+        self.ttl_ns = ttl_minutes * 60 * 1_000_000_000
         self.max_size = max_size
-        self.cache: Dict[str, Tuple[Any, datetime]] = {}
-        self.lock = Lock()
+        # Largest power of two shard count that leaves room for one entry each
+        self.num_shards = min(NUM_SHARDS, 1 << (max(max_size, 1).bit_length() - 1))
+        self.shard_size = max(max_size // self.num_shards, 1)
+        self.capacity = self.shard_size * self.num_shards
+        # Each shard keeps its entries in insertion order; reads do not
+        # reorder them, so eviction drops the least recently cached entry
+        self.shards: List[Tuple[OrderedDict[str, Tuple[Any, int]], Lock]] = [
+            (OrderedDict(), Lock()) for _ in range(self.num_shards)
+        ]
 
     def get_cache_key(self, graph_id: str, nodes_hash: str, edges_hash: str) -> str:
         """
@@ -44,7 +79,7 @@ class GraphCache:
             str: Cache key
         """
         combined = f"{graph_id}:{nodes_hash}:{edges_hash}"
-        return hashlib.md5(combined.encode()).hexdigest()
+        return xxhash.xxh3_64_hexdigest(combined.encode())
 
     def get_nodes_hash(self, nodes: list) -> str:
         """
@@ -56,19 +91,24 @@ class GraphCache:
         Returns:
             str: Hash of nodes configuration
         """
-        # Create a deterministic string representation of nodes
-        nodes_data = []
-        for node in nodes:
-            node_data = {
-                "id": node.node_id,
-                "type": node.node_type,
-                "config": node.configuration or {},
-                "position": getattr(node, "position", None),
-            }
-            nodes_data.append(str(sorted(node_data.items())))
+        # Reuse the last hash while no node was added, removed or updated
+        version = self.compute_hash_from_updated_at(nodes)
+        cached = _hashes.get("nodes")
+        if version is not None and cached and cached[0] == version:
+            return cached[1]
 
-        combined = "|".join(sorted(nodes_data))
-        return hashlib.md5(combined.encode()).hexdigest()
+        # Create a deterministic byte representation of nodes
+        nodes_data = [self._get_row_data(node, self._serialize_node) for node in nodes]
+
+        hasher = xxhash.xxh3_64()
+        for row_data in sorted(nodes_data):
+            hasher.update(row_data)
+            hasher.update(ROW_SEPARATOR)
+        nodes_hash = hasher.hexdigest()
+
+        if version is not None:
+            _hashes["nodes"] = (version, nodes_hash)
+        return nodes_hash
 
     def get_edges_hash(self, edges: list) -> str:
         """
@@ -80,19 +120,126 @@ class GraphCache:
         Returns:
             str: Hash of edges configuration
         """
-        # Create a deterministic string representation of edges
-        edges_data = []
-        for edge in edges:
-            edge_data = {
-                "from": edge.from_node_id,
-                "to": edge.to_node_id,
-                "type": edge.condition_type,
-                "config": edge.condition_config or {},
-            }
-            edges_data.append(str(sorted(edge_data.items())))
+        # Reuse the last hash while no edge was added, removed or updated
+        version = self.compute_hash_from_updated_at(edges)
+        cached = _hashes.get("edges")
+        if version is not None and cached and cached[0] == version:
+            return cached[1]
+
+        # Create a deterministic byte representation of edges
+        edges_data = [self._get_row_data(edge, self._serialize_edge) for edge in edges]
+
+        hasher = xxhash.xxh3_64()
+        for row_data in sorted(edges_data):
+            hasher.update(row_data)
+            hasher.update(ROW_SEPARATOR)
+        edges_hash = hasher.hexdigest()
+
+        if version is not None:
+            _hashes["edges"] = (version, edges_hash)
+        return edges_hash
+
+    def compute_hash_from_updated_at(self, rows: list) -> Optional[str]:
+        """
+        Generate a version hash for rows from their ids and updated_at
+        timestamps, without serializing their configuration.
 
-        combined = "|".join(sorted(edges_data))
-        return hashlib.md5(combined.encode()).hexdigest()
+        Args:
+            rows: List of GraphNode or GraphEdge instances
+
+        Returns:
+            Optional[str]: Version hash, or None if a row has no id or updated_at
+        """
+        versions = []
+        for row in rows:
+            row_id = getattr(row, "id", None)
+            updated_at = getattr(row, "updated_at", None)
+            if row_id is None or updated_at is None:
+                return None
+            versions.append(f"{row_id}:{updated_at.isoformat()}")
+
+        hasher = xxhash.xxh3_64()
+        for version in sorted(versions):
+            hasher.update(version.encode())
+            hasher.update(ROW_SEPARATOR)
+        return hasher.hexdigest()
+
+    def _get_row_data(self, row: Any, serialize: Callable[[Any], bytes]) -> bytes:
+        """
+        Get the serialized form of a node or edge row, reusing the result
+        while the row's id and updated_at are unchanged.
+
+        Args:
+            row: GraphNode or GraphEdge instance
+            serialize: Function producing the row's deterministic bytes
+
+        Returns:
+            bytes: Serialized row
+        """
+        row_id = getattr(row, "id", None)
+        updated_at = getattr(row, "updated_at", None)
+        if row_id is None or updated_at is None:
+            return serialize(row)
+
+        key = (type(row).__name__, row_id, updated_at)
+        with _row_data_lock:
+            row_data = _row_data.get(key)
+            if row_data is not None:
+                _row_data.move_to_end(key)
+                return row_data
+
+        row_data = serialize(row)
+        with _row_data_lock:
+            _row_data[key] = row_data
+            if len(_row_data) > MAX_ROW_DATA:
+                _row_data.popitem(last=False)
+        return row_data
+
+    @staticmethod
+    def _serialize_node(node: Any) -> bytes:
+        """Create a deterministic byte representation of a node."""
+        return FIELD_SEPARATOR.join(
+            (
+                node.node_id.encode(),
+                node.node_type.encode(),
+                orjson.dumps(
+                    node.configuration or {}, option=orjson.OPT_SORT_KEYS, default=str
+                ),
+            )
+        )
+
+    @staticmethod
+    def _serialize_edge(edge: Any) -> bytes:
+        """Create a deterministic byte representation of an edge."""
+        return FIELD_SEPARATOR.join(
+            (
+                edge.from_node_id.encode(),
+                edge.to_node_id.encode(),
+                (edge.condition_type or "").encode(),
+                orjson.dumps(
+                    edge.condition_config or {},
+                    option=orjson.OPT_SORT_KEYS,
+                    default=str,
+                ),
+            )
+        )
+
+    def _get_shard(
+        self, cache_key: str
+    ) -> Tuple[OrderedDict[str, Tuple[Any, int]], Lock]:
+        """
+        Get the shard responsible for a cache key.
+
+        Args:
+            cache_key: Cache key
+
+        Returns:
+            Tuple[OrderedDict, Lock]: Shard entries and the lock guarding them
+        """
+        shard_index = xxhash.xxh3_64_intdigest(cache_key.encode()) & (
+            self.num_shards - 1
+        )
+        return self.shards[shard_index]
 
     def get(self, cache_key: str) -> Optional[Any]:
         """
@@ -104,20 +251,26 @@ class GraphCache:
         Returns:
             Optional[Any]: Cached graph or None
         """
-        with self.lock:
-            if cache_key not in self.cache:
-                return None
+        cache, lock = self._get_shard(cache_key)
 
-            graph, cached_at = self.cache[cache_key]
+        # Single dict read, atomic under the GIL - hits never take the lock
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
 
-            # Check if expired
-            if datetime.utcnow() - cached_at > self.ttl:
-                del self.cache[cache_key]
-                logger.debug(f"Cache expired for key: {cache_key}")
-                return None
+        graph, cached_at = entry
 
-            logger.debug(f"Cache hit for key: {cache_key}")
-            return graph
+        # Check if expired
+        if monotonic_ns() - cached_at > self.ttl_ns:
+            with lock:
+                # Only drop the entry if it was not replaced meanwhile
+                if cache.get(cache_key) is entry:
+                    del cache[cache_key]
+                    logger.debug(f"Cache expired for key: {cache_key}")
+            return None
+
+        logger.debug(f"Cache hit for key: {cache_key}")
+        return graph
 
     def put(self, cache_key: str, graph: Any) -> None:
         """
@@ -127,15 +280,19 @@ class GraphCache:
             cache_key: Cache key
             graph: Compiled graph to cache
         """
-        with self.lock:
-            # Implement LRU eviction if cache is full
-            if len(self.cache) >= self.max_size:
-                # Remove oldest entry
-                oldest_key = min(self.cache.keys(), key=lambda k: self.cache[k][1])
-                del self.cache[oldest_key]
+        cache, lock = self._get_shard(cache_key)
+        with lock:
+            # Drop expired entries first so they don't take eviction slots
+            self._sweep_expired(cache, monotonic_ns())
+
+            if cache_key in cache:
+                cache.move_to_end(cache_key)
+            elif len(cache) >= self.shard_size:
+                # Evict the shard's least recently cached entry
+                oldest_key, _ = cache.popitem(last=False)
                 logger.debug(f"Evicted cache entry: {oldest_key}")
 
-            self.cache[cache_key] = (graph, datetime.utcnow())
+            cache[cache_key] = (graph, monotonic_ns())
             logger.debug(f"Cached graph with key: {cache_key}")
 
     def invalidate(self, cache_key: str) -> bool:
@@ -148,9 +305,10 @@ class GraphCache:
         Returns:
             bool: True if entry was found and removed
         """
-        with self.lock:
-            if cache_key in self.cache:
-                del self.cache[cache_key]
+        cache, lock = self._get_shard(cache_key)
+        with lock:
+            if cache_key in cache:
+                del cache[cache_key]
                 logger.debug(f"Invalidated cache entry: {cache_key}")
                 return True
             return False
@@ -159,9 +317,13 @@ class GraphCache:
         """
         Clear all cache entries.
         """
-        with self.lock:
-            self.cache.clear()
-            logger.debug("Cleared all cache entries")
+        for cache, lock in self.shards:
+            with lock:
+                cache.clear()
+        with _row_data_lock:
+            _row_data.clear()
+        _hashes.clear()
+        logger.debug("Cleared all cache entries")
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -170,19 +332,25 @@ class GraphCache:
         Returns:
             Dict[str, Any]: Cache statistics
         """
-        with self.lock:
-            now = datetime.utcnow()
-            expired_count = sum(
-                1 for _, cached_at in self.cache.values() if now - cached_at > self.ttl
-            )
-
-            return {
-                "total_entries": len(self.cache),
-                "expired_entries": expired_count,
-                "active_entries": len(self.cache) - expired_count,
-                "max_size": self.max_size,
-                "ttl_minutes": self.ttl.total_seconds() / 60,
-            }
+        total_count = 0
+        expired_count = 0
+        for cache, lock in self.shards:
+            with lock:
+                now = monotonic_ns()
+                total_count += len(cache)
+                expired_count += sum(
+                    1
+                    for _, cached_at in cache.values()
+                    if now - cached_at > self.ttl_ns
+                )
+
+        return {
+            "total_entries": total_count,
+            "expired_entries": expired_count,
+            "active_entries": total_count - expired_count,
+            "max_size": self.capacity,
+            "ttl_minutes": self.ttl_minutes,
+        }
 
     def cleanup_expired(self) -> int:
         """
@@ -191,18 +359,36 @@ class GraphCache:
         Returns:
             int: Number of entries removed
         """
-        with self.lock:
-            now = datetime.utcnow()
-            expired_keys = [
-                key
-                for key, (_, cached_at) in self.cache.items()
-                if now - cached_at > self.ttl
-            ]
+        removed_count = 0
+        for cache, lock in self.shards:
+            with lock:
+                removed_count += self._sweep_expired(cache, monotonic_ns())
 
-            for key in expired_keys:
-                del self.cache[key]
+        if removed_count:
+            logger.debug(f"Cleaned up {removed_count} expired cache entries")
+
+        return removed_count
+
+    def _sweep_expired(self, cache: OrderedDict[str, Tuple[Any, int]], now: int) -> int:
+        """
+        Remove expired entries from the front of a shard.
 
-            if expired_keys:
-                logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+        Entries are kept in the order they were cached, so expired entries
+        are always at the front and the sweep stops at the first live one.
+        The caller must hold the shard's lock.
 
-            return len(expired_keys)
+        Args:
+            cache: Shard entries
+            now: Current monotonic time in nanoseconds
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed_count = 0
+        while cache:
+            _, cached_at = next(iter(cache.values()))
+            if now - cached_at <= self.ttl_ns:
+                break
+            cache.popitem(last=False)
+            removed_count += 1
+        return removed_count
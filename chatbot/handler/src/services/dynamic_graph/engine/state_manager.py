@@ -11,11 +11,65 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from langgraph.graph import MessagesState
 from langchain_postgres import PostgresChatMessageHistory
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import (
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    messages_from_dict,
+)
+from psycopg import sql
 
 from database import database
 
+# System message for context (similar to static graph), shared by all executions.
+# The fixed id keeps add_messages from assigning one to the shared instance.
+SYSTEM_MESSAGE = SystemMessage(
+    id="dynamic-graph-system-message",
+    content="""You are a helpful assistant designed to provide accurate and relevant answers. Follow these guidelines:
+        1. Answer the user's question to the best of your ability in a clear, concise, and conversational tone.
+        2. If you don't know the answer, respond with "I don't know" and suggest how the user can find the information.
+        3. If the question is unclear, ask the user to clarify or provide more details.
+        4. Use the provided conversation history to give contextually relevant answers.
+        5. If more context is needed, ask the user for additional details.
+        The user's question follows the history.""",
+)
+
+# Table holding conversation history and the number of past messages used
+HISTORY_TABLE = "chat_history"
+HISTORY_LIMIT = 10
+
+# Per-execution objects kept out of the graph state, keyed by execution ID
+_execution_context: Dict[str, Dict[str, Any]] = {}
+
+
+def _get_recent_messages(session_id: str, limit: int) -> List[BaseMessage]:
+    """
+    Load the most recent messages of a session's conversation history.
+
+    PostgresChatMessageHistory.get_messages() always loads the whole
+    history, so the limit is applied in SQL instead.
 
+    Args:
+        session_id: The session ID
+        limit: Maximum number of messages to load
+
+    Returns:
+        List[BaseMessage]: Up to limit messages, oldest first
+    """
+    query = sql.SQL(
+        "SELECT message FROM {table} WHERE session_id = %(session_id)s "
+        "ORDER BY id DESC LIMIT %(limit)s"
+    ).format(table=sql.Identifier(HISTORY_TABLE))
+
+    with database.sync_connection.cursor() as cursor:
+        cursor.execute(query, {"session_id": session_id, "limit": limit})
+        records = cursor.fetchall()
+
+    return messages_from_dict([record[0] for record in reversed(records)])
+
+
+# Not slots=True: MessagesState is a TypedDict, so this class is a dict subclass
+# and dataclass(slots=True) fails to recreate it with a non-TypedDict base.
 @dataclass
 class DynamicState(MessagesState):
     """
@@ -57,33 +111,16 @@ class DynamicStateManager:
         """
         # Initialize conversation history (same as static graph)
         conversation_history = PostgresChatMessageHistory(
-            "chat_history",
+            HISTORY_TABLE,
             session_id,
             sync_connection=database.sync_connection,
         )
 
-        # Get existing conversation history
-        history_messages = conversation_history.get_messages()
-
         # Get the last 10 messages, or all if fewer than 10 (same logic as static graph)
-        last_10_messages = (
-            history_messages[-10:] if len(history_messages) > 10 else history_messages
-        )
-
-        # Create system message for context (similar to static graph)
-        system_message_content = """You are a helpful assistant designed to provide accurate and relevant answers. Follow these guidelines:
-        1. Answer the user's question to the best of your ability in a clear, concise, and conversational tone.
-        2. If you don't know the answer, respond with "I don't know" and suggest how the user can find the information.
-        3. If the question is unclear, ask the user to clarify or provide more details.
-        4. Use the provided conversation history to give contextually relevant answers.
-        5. If more context is needed, ask the user for additional details.
-        The user's question follows the history."""
+        last_10_messages = _get_recent_messages(session_id, HISTORY_LIMIT)
 
         # Build context messages with history
-        context_messages = [
-            SystemMessage(content=system_message_content.strip()),
-            *last_10_messages,
-        ]
+        context_messages = [SYSTEM_MESSAGE, *last_10_messages]
 
         # Add the new user message
         new_user_message = HumanMessage(content=input_message.strip())
@@ -92,7 +129,14 @@ class DynamicStateManager:
         all_messages = context_messages + [new_user_message]
 
         # Store only the context messages for filtering (NOT the new user message)
-        # This way the new user message and AI response will be processed and returned
+        # This way the new user message and AI response will be processed and returned.
+        # The history connection and context stay out of the graph state so
+        # LangGraph doesn't carry them through every step.
+        _execution_context[str(execution_id)] = {
+            "conversation_history": conversation_history,
+            "context_messages": context_messages,
+            "original_message_count": len(all_messages),
+        }
 
         # Create state as dictionary (LangGraph expects dict-like access)
         state = {
@@ -101,27 +145,48 @@ class DynamicStateManager:
             "session_id": session_id,
             "chat_id": str(chat_id) if chat_id else None,
             "condition_result": None,
-            "_conversation_history": conversation_history,  # Store for later use
-            "_context_messages": context_messages,  # Store only context, NOT the new user message
-            "_original_message_count": len(
-                all_messages
-            ),  # Track original count for filtering
         }
 
         return state
 
+    @staticmethod
+    def get_context_messages(state: Dict[str, Any]) -> List[Any]:
+        """
+        Get the history context messages the execution started with.
+
+        Args:
+            state: The initial execution state
+
+        Returns:
+            List[Any]: System and history messages (excluding the new user message)
+        """
+        context = _execution_context.get(state.get("execution_id"), {})
+        return context.get("context_messages", [])
+
+    @staticmethod
+    def release_execution(execution_id: Any) -> None:
+        """
+        Drop the per-execution context kept for an execution.
+
+        Args:
+            execution_id: The graph execution ID
+        """
+        _execution_context.pop(str(execution_id), None)
+
     @staticmethod
     def save_conversation_history(
         state: Dict[str, Any], filtered_messages: List[Any]
     ) -> None:
         """
-        Save new messages to conversation history.
+        Save new messages to conversation history and release the
+        execution's context.
 
         Args:
-            state: The execution state containing conversation history
+            state: The initial execution state
             filtered_messages: Already filtered new messages to save
         """
-        conversation_history = state.get("_conversation_history")
+        context = _execution_context.pop(state.get("execution_id"), {})
+        conversation_history = context.get("conversation_history")
 
         if conversation_history and filtered_messages:
             # Save the already filtered messages to conversation history
@@ -4,6 +4,18 @@ Dynamic Graph Execution
 Components for tracking and monitoring graph execution.
 """
 
-from .tracker import ExecutionTracker
+from .tracker import (
+    ExecutionTracker,
+    STATUS_RUNNING,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    FINISHED_STATUSES,
+)
 
-__all__ = ["ExecutionTracker"]
+__all__ = [
+    "ExecutionTracker",
+    "STATUS_RUNNING",
+    "STATUS_COMPLETED",
+    "STATUS_FAILED",
+    "FINISHED_STATUSES",
+]
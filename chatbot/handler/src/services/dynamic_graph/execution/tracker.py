@@ -5,25 +5,143 @@ Tracks graph executions and node executions in the database.
 """
 
 import logging
-from typing import Optional, List
+import queue
+from typing import Any, Dict, Final, Optional, List
 from sqlalchemy.orm import Session
 from datetime import datetime
+from threading import Event, Lock, Thread
 
+from database.database import get_session
 from database.models import GraphExecution, NodeExecution
 from repositories.graph import GraphExecutionRepository
 from schemas.requests.graph import GraphExecutionCreate
 
 logger = logging.getLogger(__name__)
 
+# Node execution statuses, shared with the node handlers that report them
+STATUS_RUNNING: Final = "running"
+STATUS_COMPLETED: Final = "completed"
+STATUS_FAILED: Final = "failed"
+
+# Statuses that end a node execution
+FINISHED_STATUSES: Final = frozenset({STATUS_COMPLETED, STATUS_FAILED})
+
+
+class NodeExecutionWriter:
+    """
+    Writes node execution records from a background thread.
+
+    Records are queued without touching the database and inserted in
+    batches by a daemon thread using its own session, so node handlers
+    never wait on a database round-trip.
+    """
+
+    def __init__(self, batch_size: int = 16, flush_timeout_seconds: int = 30):
+        self.batch_size = batch_size
+        self.flush_timeout_seconds = flush_timeout_seconds
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[Thread] = None
+        self._thread_lock = Lock()
+
+    def submit(self, node_execution: Dict[str, Any]) -> None:
+        """
+        Queue a node execution record for writing.
+
+        Args:
+            node_execution: NodeExecution column values
+        """
+        self._ensure_started()
+        self._queue.put_nowait(node_execution)
+
+    def flush(self) -> bool:
+        """
+        Wait until every record queued so far has been written.
+
+        Returns:
+            bool: True if the queue drained before the timeout
+        """
+        self._ensure_started()
+        barrier = Event()
+        self._queue.put_nowait(barrier)
+        if not barrier.wait(self.flush_timeout_seconds):
+            logger.warning("Timed out waiting for node execution records to flush")
+            return False
+        return True
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread on first use."""
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run, name="node-execution-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Drain the queue, writing records in batches."""
+        while True:
+            item = self._queue.get()
+            batch: List[Dict[str, Any]] = []
+            barriers: List[Event] = []
+
+            # Collect whatever is already queued, up to one batch
+            while True:
+                if isinstance(item, Event):
+                    barriers.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+
+            # Everything queued before these barriers is now written
+            for barrier in barriers:
+                barrier.set()
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Insert a batch of node execution records.
+
+        Args:
+            batch: NodeExecution column values
+        """
+        db = get_session()
+        try:
+            GraphExecutionRepository(db).bulk_create_node_executions(batch)
+            logger.debug(f"Recorded {len(batch)} node executions")
+        except Exception as e:
+            db.rollback()
+            logger.error(
+                f"Failed to record {len(batch)} node executions in database: {e}"
+            )
+        finally:
+            db.close()
+
+
+node_execution_writer = NodeExecutionWriter()
+
 
 class ExecutionTracker:
     """
     Tracks graph executions and node executions in the database.
+
+    Node execution records are handed to the background
+    NodeExecutionWriter and flushed whenever the graph execution finishes
+    or node executions are read back.
     """
 
     def __init__(self, db_session: Session):
         self.db = db_session
         self.repo = GraphExecutionRepository(db_session)
+        self.writer = node_execution_writer
 
     def start_execution(
         self, chat_id: Optional[str], session_id: str
@@ -38,10 +156,11 @@ class ExecutionTracker:
         logger.info(f"Started graph execution: {execution.id}")
         return execution
 
-    def complete_execution(self, execution_id, status: str = "completed"):
+    def complete_execution(self, execution_id, status: str = STATUS_COMPLETED):
         """
         Mark a graph execution as completed.
         """
+        self.flush()
         self.repo.update_execution_status(execution_id, status)
         logger.info(f"Completed graph execution: {execution_id}")
 
@@ -49,8 +168,9 @@ class ExecutionTracker:
         """
         Mark a graph execution as failed.
         """
+        self.flush()
         self.repo.update_execution_status(
-            execution_id, "failed", error_message=error_message
+            execution_id, STATUS_FAILED, error_message=error_message
         )
         logger.warning(f"Failed graph execution: {execution_id} ({error_message})")
 
@@ -58,26 +178,37 @@ class ExecutionTracker:
         """
         Get all node executions for a graph execution.
         """
+        self.flush()
         return self.repo.get_node_executions_by_execution(execution_id)
 
     def record_node_execution(
-        self, execution_id, node_id, status: str = "running", **kwargs
-    ) -> NodeExecution:
-        """
-        Record a node execution.
-        """
-        node_execution = self.repo.create_node_execution(
-            execution_id=execution_id,
-            node_id=node_id,
-            status=status,
-            started_at=datetime.utcnow() if status == "running" else None,
-            completed_at=(
-                datetime.utcnow() if status in ["completed", "failed"] else None
+        self, execution_id, node_id, status: str = STATUS_RUNNING, **kwargs
+    ) -> None:
+        """
+        Queue a node execution record for the background writer.
+        """
+        node_execution = {
+            "execution_id": execution_id,
+            "node_id": node_id,
+            "status": status,
+            "started_at": datetime.utcnow() if status == STATUS_RUNNING else None,
+            "completed_at": (
+                datetime.utcnow() if status in FINISHED_STATUSES else None
             ),
             **kwargs,
-        )
-        logger.debug(f"Recorded node execution: {node_execution.id} for node {node_id}")
-        return node_execution
+        }
+
+        self.writer.submit(node_execution)
+        logger.debug(f"Queued node execution for node {node_id}")
+
+    def flush(self) -> bool:
+        """
+        Wait until queued node execution records have been written.
+
+        Returns:
+            bool: True if all records were flushed before the timeout
+        """
+        return self.writer.flush()
 
     def update_node_execution(
         self, node_execution_id, status: str, **kwargs
@@ -85,8 +216,9 @@ class ExecutionTracker:
         """
         Update a node execution.
         """
+        self.flush()
         update_data = {"status": status, **kwargs}
-        if status in ["completed", "failed"]:
+        if status in FINISHED_STATUSES:
             update_data["completed_at"] = datetime.utcnow()
 
         return self.repo.update_node_execution(node_execution_id, **update_data)
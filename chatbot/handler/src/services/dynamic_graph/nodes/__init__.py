@@ -2,16 +2,33 @@
 Dynamic Graph Node Handlers
 
 Node handlers for different types of graph nodes (LLM, Tool, Condition, etc.)
+
+Concrete handlers are imported on first access so that importing the
+registry doesn't pull in every handler's dependencies.
 """
 
+import importlib
+
 from .base_handler import BaseNodeHandler
-from .llm_handler import LLMNodeHandler
-from .tool_handler import ToolNodeHandler
-from .condition_handler import ConditionNodeHandler
-from .human_handler import HumanNodeHandler
-from .start_end_handler import StartEndNodeHandler
 from .handler_registry import NodeHandlerRegistry
 
+_LAZY_HANDLERS = {
+    "LLMNodeHandler": ".llm_handler",
+    "ToolNodeHandler": ".tool_handler",
+    "ConditionNodeHandler": ".condition_handler",
+    "HumanNodeHandler": ".human_handler",
+    "StartEndNodeHandler": ".start_end_handler",
+}
+
+
+def __getattr__(name):
+    """Import a concrete handler class on first access."""
+    module_name = _LAZY_HANDLERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
+
+
 __all__ = [
     "BaseNodeHandler",
     "LLMNodeHandler",
@@ -23,6 +23,10 @@ class BaseNodeHandler(ABC):
     in the dynamic graph system.
     """
 
+    # Handlers live as long as the graphs built from them; subclasses
+    # declare empty __slots__ so instances carry no __dict__
+    __slots__ = ("config_manager", "execution_tracker")
+
     def __init__(self, config_manager, execution_tracker=None):
         self.config_manager = config_manager
         self.execution_tracker = execution_tracker
@@ -78,12 +82,12 @@ class BaseNodeHandler(ABC):
             error_message: Optional error message
             **kwargs: Additional execution data
         """
-        log_data = {"node_id": node_id, "status": status, **kwargs}
-
         if error_message:
+            log_data = {"node_id": node_id, "status": status, **kwargs}
             log_data["error"] = error_message
             logger.error(f"Node execution failed: {log_data}")
-        else:
+        elif logger.isEnabledFor(logging.INFO):
+            log_data = {"node_id": node_id, "status": status, **kwargs}
             logger.info(f"Node execution: {log_data}")
 
         # Record in database if tracker is available and execution_id is provided
@@ -6,15 +6,22 @@ conditional logic and branching.
 """
 
 import logging
-from typing import Dict, Any, Callable
+import re
+from functools import partial
+from typing import Dict, Any, Callable, List, Optional, Pattern, Tuple
+from langchain_core.messages import AIMessage
 from langgraph.types import Command
 
 from database.models import GraphNode
 from .base_handler import BaseNodeHandler
+from ..execution.tracker import STATUS_RUNNING, STATUS_COMPLETED, STATUS_FAILED
 from ..engine.state_manager import DynamicState
 
 logger = logging.getLogger(__name__)
 
+# Number of trailing messages searched for a tool result
+TOOL_RESULT_SCAN_WINDOW = 4
+
 
 class ConditionNodeHandler(BaseNodeHandler):
     """
@@ -24,6 +31,8 @@ class ConditionNodeHandler(BaseNodeHandler):
     message content, tool results, or custom conditions.
     """
 
+    __slots__ = ()
+
     def create_handler(self, node: GraphNode) -> Callable:
         """
         Create a LangGraph node handler function for condition nodes.
@@ -35,26 +44,45 @@ class ConditionNodeHandler(BaseNodeHandler):
             Callable: Function that can be used as a LangGraph node
         """
 
+        # Resolve configuration once; it is fixed for the compiled graph
+        try:
+            node_config = self.get_node_config(node)
+            config_error = None
+        except Exception as e:
+            node_config = {}
+            config_error = str(e)
+
+        evaluation_type = node_config.get("evaluation_type", "message_content")
+        default = node_config.get("default", "end")
+
+        # Lowercase condition keys once instead of on every evaluation
+        patterns = self._compile_condition_patterns(node_config.get("conditions", {}))
+
+        # Pick the evaluator once; each visit is then a single call
+        evaluator = self._select_evaluator(node_config, patterns)
+
         def condition_handler(state: DynamicState) -> Command:
             try:
-                # Get node configuration
-                node_config = self.get_node_config(node)
+                if config_error:
+                    raise ValueError(config_error)
 
                 # Log execution start
                 self.log_node_execution(
                     node.node_id,
-                    "running",
-                    evaluation_type=node_config.get(
-                        "evaluation_type", "message_content"
-                    ),
+                    STATUS_RUNNING,
+                    evaluation_type=evaluation_type,
                 )
 
                 # Evaluate condition
-                result = self._evaluate_condition(state, node_config)
+                try:
+                    result = evaluator(state)
+                except Exception as e:
+                    logger.error(f"Condition evaluation failed: {e}")
+                    result = default
 
                 # Log successful execution
                 self.log_node_execution(
-                    node.node_id, "completed", condition_result=result
+                    node.node_id, STATUS_COMPLETED, condition_result=result
                 )
 
                 # Return result for conditional edge routing
@@ -62,7 +90,9 @@ class ConditionNodeHandler(BaseNodeHandler):
 
             except Exception as e:
                 error_msg = f"Condition node execution failed: {str(e)}"
-                self.log_node_execution(node.node_id, "failed", error_message=error_msg)
+                self.log_node_execution(
+                    node.node_id, STATUS_FAILED, error_message=error_msg
+                )
                 return self.create_error_command(error_msg)
 
         return condition_handler
@@ -101,40 +131,101 @@ class ConditionNodeHandler(BaseNodeHandler):
 
         return True
 
-    def _evaluate_condition(
-        self, state: DynamicState, node_config: Dict[str, Any]
-    ) -> str:
+    @staticmethod
+    def _compile_keyword_regex(
+        patterns: List[Tuple[str, str]],
+    ) -> Optional[Pattern[str]]:
         """
-        Evaluate condition based on configuration and current state.
+        Compile the condition keys into a single alternation regex.
+
+        The regex only answers whether any key occurs in a text, in one
+        C-level pass. The ordered pattern list still decides which key
+        wins, so the first matching condition keeps priority.
+
+        Args:
+            patterns: Precompiled condition patterns
+
+        Returns:
+            Optional[Pattern[str]]: Regex matching any lowercased key, or None
+        """
+        if not patterns:
+            return None
+        return re.compile(
+            "|".join(re.escape(condition_key) for condition_key, _ in patterns)
+        )
+
+    @staticmethod
+    def _compile_condition_patterns(
+        conditions: Dict[str, str],
+    ) -> List[Tuple[str, str]]:
+        """
+        Precompute lowercased condition keys for keyword matching.
+
+        Args:
+            conditions: Condition mapping
+
+        Returns:
+            List[Tuple[str, str]]: (lowercased condition key, next node) pairs
+        """
+        return [
+            (condition_key.lower(), next_node)
+            for condition_key, next_node in conditions.items()
+        ]
+
+    def _select_evaluator(
+        self,
+        node_config: Dict[str, Any],
+        patterns: List[Tuple[str, str]],
+    ) -> Callable[[DynamicState], str]:
+        """
+        Select the condition evaluator for a node's configuration.
 
         Args:
-            state: Current execution state
             node_config: Node configuration
+            patterns: Precompiled condition patterns
 
         Returns:
-            str: Condition result (should match a key in conditions dict)
+            Callable[[DynamicState], str]: Evaluator returning the condition
+            result (should match a key in conditions dict)
         """
         evaluation_type = node_config.get("evaluation_type", "message_content")
         conditions = node_config.get("conditions", {})
         default = node_config.get("default", "end")
 
-        try:
-            if evaluation_type == "message_content":
-                return self._evaluate_message_content(state, conditions, default)
-            elif evaluation_type == "tool_result":
-                return self._evaluate_tool_result(state, conditions, default)
-            elif evaluation_type == "custom":
-                return self._evaluate_custom_condition(state, node_config, default)
-            else:
-                logger.warning(f"Unknown evaluation type: {evaluation_type}")
-                return default
-
-        except Exception as e:
-            logger.error(f"Condition evaluation failed: {e}")
-            return default
+        keyword_regex = self._compile_keyword_regex(patterns)
+
+        if evaluation_type == "message_content":
+            return partial(
+                self._evaluate_message_content,
+                conditions=conditions,
+                default=default,
+                patterns=patterns,
+                keyword_regex=keyword_regex,
+            )
+        elif evaluation_type == "tool_result":
+            return partial(
+                self._evaluate_tool_result,
+                default=default,
+                patterns=patterns,
+                keyword_regex=keyword_regex,
+            )
+        elif evaluation_type == "custom":
+            return partial(
+                self._evaluate_custom_condition,
+                node_config=node_config,
+                default=default,
+            )
+        else:
+            logger.warning(f"Unknown evaluation type: {evaluation_type}")
+            return lambda state: default
 
     def _evaluate_message_content(
-        self, state: DynamicState, conditions: Dict[str, str], default: str
+        self,
+        state: DynamicState,
+        conditions: Dict[str, str],
+        default: str,
+        patterns: List[Tuple[str, str]],
+        keyword_regex: Optional[Pattern[str]],
     ) -> str:
         """
         Evaluate condition based on message content.
@@ -143,58 +234,86 @@ class ConditionNodeHandler(BaseNodeHandler):
             state: Current execution state
             conditions: Condition mapping
             default: Default result
+            patterns: Precompiled condition patterns
+            keyword_regex: Regex matching any condition key
 
         Returns:
             str: Condition result
         """
-        if not state.messages:
+        messages = state.get("messages")
+        if not messages:
             return default
 
-        last_message = state.messages[-1]
-        content = getattr(last_message, "content", "")
+        last_message = messages[-1]
 
-        if not content:
-            return default
+        # AI messages always define content and tool_calls, so the common
+        # case reads both directly instead of probing with hasattr/getattr
+        if isinstance(last_message, AIMessage):
+            content = last_message.content
+            if not content:
+                return default
 
-        # Check for tool calls (continue to tools)
-        if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-            return conditions.get("continue", default)
+            # Check for tool calls (continue to tools)
+            if last_message.tool_calls:
+                return conditions.get("continue", default)
+        else:
+            content = getattr(last_message, "content", "")
+            if not content:
+                return default
 
         # Check for specific content patterns
         content_lower = content.lower()
 
-        for condition_key, next_node in conditions.items():
+        # Most messages match no condition; rule that out in a single scan
+        if keyword_regex is None or not keyword_regex.search(content_lower):
+            return default
+
+        for condition_key, next_node in patterns:
             # Simple keyword matching (can be enhanced)
-            if condition_key.lower() in content_lower:
+            if condition_key in content_lower:
                 return next_node
 
         return default
 
     def _evaluate_tool_result(
-        self, state: DynamicState, conditions: Dict[str, str], default: str
+        self,
+        state: DynamicState,
+        default: str,
+        patterns: List[Tuple[str, str]],
+        keyword_regex: Optional[Pattern[str]],
     ) -> str:
         """
         Evaluate condition based on tool execution results.
 
         Args:
             state: Current execution state
-            conditions: Condition mapping
             default: Default result
+            patterns: Precompiled condition patterns
+            keyword_regex: Regex matching any condition key
 
         Returns:
             str: Condition result
         """
-        if not state.messages:
+        messages = state.get("messages")
+        if not messages or keyword_regex is None:
             return default
 
-        # Look for tool messages
-        for message in reversed(state.messages):
-            if hasattr(message, "name") and message.name:
-                # Check if this tool result matches any conditions
-                tool_name = message.name
-                for condition_key, next_node in conditions.items():
-                    if condition_key.lower() in tool_name.lower():
-                        return next_node
+        # Tool results sit at the end of the history, so only look for tool
+        # messages in the last few messages instead of the whole history
+        for i in range(
+            len(messages) - 1, max(-1, len(messages) - 1 - TOOL_RESULT_SCAN_WINDOW), -1
+        ):
+            name = getattr(messages[i], "name", None)
+            if not name:
+                continue
+
+            # Check if this tool result matches any conditions
+            tool_name = name.lower()
+            if not keyword_regex.search(tool_name):
+                continue
+            for condition_key, next_node in patterns:
+                if condition_key in tool_name:
+                    return next_node
 
         return default
 
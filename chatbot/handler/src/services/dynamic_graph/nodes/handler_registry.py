@@ -4,43 +4,76 @@ Node Handler Registry
 Registry for managing and retrieving node handlers by node type.
 """
 
+import importlib
 import logging
-from typing import Dict, Type, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, Optional, Union
 from .base_handler import BaseNodeHandler
-from .llm_handler import LLMNodeHandler
-from .tool_handler import ToolNodeHandler
-from .condition_handler import ConditionNodeHandler
-from .human_handler import HumanNodeHandler
-from .start_end_handler import StartEndNodeHandler
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _materialise(path: str) -> Type[BaseNodeHandler]:
+    """
+    Import a handler class from a "module:Class" path.
+
+    Module paths starting with "." are resolved relative to this package.
+
+    Args:
+        path: Handler class path
+
+    Returns:
+        Type[BaseNodeHandler]: Handler class
+    """
+    module_name, class_name = path.split(":")
+    module = importlib.import_module(module_name, package=__package__)
+    return getattr(module, class_name)
+
+
 class NodeHandlerRegistry:
     """
     Registry for node handlers.
 
     Manages the mapping between node types and their corresponding
-    handler classes.
+    handler classes. Default handlers are registered by import path, so
+    importing the registry doesn't import them; each is imported and
+    instantiated on its first get_handler call.
     """
 
+    __slots__ = (
+        "config_manager",
+        "execution_tracker",
+        "_handlers",
+        "_instances",
+        "_handler_names",
+        "_handlers_get",
+        "_instances_get",
+    )
+
     def __init__(self, config_manager, execution_tracker=None):
         self.config_manager = config_manager
         self.execution_tracker = execution_tracker
-        self._handlers: Dict[str, Type[BaseNodeHandler]] = {}
+        self._handlers: Dict[str, Union[str, Type[BaseNodeHandler]]] = {}
         self._instances: Dict[str, BaseNodeHandler] = {}
+        # list_handlers() result, rebuilt after the next registration
+        self._handler_names: Optional[Mapping[str, str]] = None
+        # Bound lookups for the per-node dispatch path
+        self._handlers_get = self._handlers.get
+        self._instances_get = self._instances.get
 
         # Register default handlers
         self._register_default_handlers()
 
     def _register_default_handlers(self):
         """Register the default node handlers."""
-        self.register_handler("llm", LLMNodeHandler)
-        self.register_handler("tool", ToolNodeHandler)
-        self.register_handler("condition", ConditionNodeHandler)
-        self.register_handler("human", HumanNodeHandler)
-        self.register_handler("start", StartEndNodeHandler)
-        self.register_handler("end", StartEndNodeHandler)
+        self.register_lazy("llm", ".llm_handler:LLMNodeHandler")
+        self.register_lazy("tool", ".tool_handler:ToolNodeHandler")
+        self.register_lazy("condition", ".condition_handler:ConditionNodeHandler")
+        self.register_lazy("human", ".human_handler:HumanNodeHandler")
+        self.register_lazy("start", ".start_end_handler:StartEndNodeHandler")
+        self.register_lazy("end", ".start_end_handler:StartEndNodeHandler")
 
     def register_handler(self, node_type: str, handler_class: Type[BaseNodeHandler]):
         """
@@ -51,8 +84,24 @@ class NodeHandlerRegistry:
             handler_class: Handler class to register
         """
         self._handlers[node_type] = handler_class
+        self._instances.pop(node_type, None)
+        self._handler_names = None
         logger.info(f"Registered handler for node type: {node_type}")
 
+    def register_lazy(self, node_type: str, handler_path: str):
+        """
+        Register a node handler by import path, deferring the import until
+        the handler is first needed.
+
+        Args:
+            node_type: Type of node (e.g., 'llm', 'tool', 'condition')
+            handler_path: Handler class path as "module:Class"
+        """
+        self._handlers[node_type] = handler_path
+        self._instances.pop(node_type, None)
+        self._handler_names = None
+        logger.info(f"Registered lazy handler for node type: {node_type}")
+
     def get_handler(self, node_type: str) -> Optional[BaseNodeHandler]:
         """
         Get a handler instance for a node type.
@@ -63,18 +112,28 @@ class NodeHandlerRegistry:
         Returns:
             BaseNodeHandler: Handler instance or None if not found
         """
-        # Check if we have a cached instance
-        if node_type in self._instances:
-            return self._instances[node_type]
+        handler_instance = self._instances_get(node_type)
+        if handler_instance is not None:
+            return handler_instance
 
-        # Get handler class
-        handler_class = self._handlers.get(node_type)
-        if not handler_class:
+        # First request for this node type, or its creation failed before
+        if node_type not in self._handlers:
             logger.warning(f"No handler registered for node type: {node_type}")
             return None
+        return self._create_instance(node_type)
 
-        # Create and cache instance
+    def _create_instance(self, node_type: str) -> Optional[BaseNodeHandler]:
+        """
+        Create and cache the handler instance for a registered node type.
+
+        Args:
+            node_type: Type of node
+
+        Returns:
+            BaseNodeHandler: Handler instance or None if creation failed
+        """
         try:
+            handler_class = self.get_handler_class(node_type)
             handler_instance = handler_class(
                 self.config_manager, self.execution_tracker
             )
@@ -94,19 +153,32 @@ class NodeHandlerRegistry:
         Returns:
             Type[BaseNodeHandler]: Handler class or None if not found
         """
-        return self._handlers.get(node_type)
+        handler_class = self._handlers_get(node_type)
+        if isinstance(handler_class, str):
+            handler_class = _materialise(handler_class)
+            self._handlers[node_type] = handler_class
+        return handler_class
 
-    def list_handlers(self) -> Dict[str, str]:
+    def list_handlers(self) -> Mapping[str, str]:
         """
         List all registered handlers.
 
         Returns:
-            Dict[str, str]: Mapping of node types to handler class names
+            Mapping[str, str]: Read-only mapping of node types to handler
+            class names
         """
-        return {
-            node_type: handler_class.__name__
-            for node_type, handler_class in self._handlers.items()
-        }
+        if self._handler_names is None:
+            self._handler_names = MappingProxyType(
+                {
+                    node_type: (
+                        handler_class.rpartition(":")[2]
+                        if isinstance(handler_class, str)
+                        else handler_class.__name__
+                    )
+                    for node_type, handler_class in self._handlers.items()
+                }
+            )
+        return self._handler_names
 
     def has_handler(self, node_type: str) -> bool:
         """
@@ -6,16 +6,85 @@ These nodes pause execution and wait for human input.
 """
 
 import logging
-from typing import Dict, Any, Callable
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, Any, Callable, Iterator, Mapping, Set
 from langgraph.types import Command, interrupt
 from langchain_core.messages import HumanMessage
 
 from database.models import GraphNode
 from .base_handler import BaseNodeHandler
+from ..execution.tracker import STATUS_RUNNING, STATUS_COMPLETED, STATUS_FAILED
 from ..engine.state_manager import DynamicState
 
 logger = logging.getLogger(__name__)
 
+# Placeholders a human node prompt template may use
+TEMPLATE_FIELDS = frozenset({"query", "session_id", "execution_id"})
+
+# Prompt used when a node's template has unknown placeholders
+DEFAULT_PROMPT_TEMPLATE = "Please provide assistance for: {query}"
+
+
+def _get_template_fields(template: str) -> Set[str]:
+    """
+    Get the names looked up by a template's placeholders.
+
+    Args:
+        template: Prompt template with str.format placeholders
+
+    Returns:
+        Set[str]: Placeholder names (e.g. "query" for "{query.title}")
+
+    Raises:
+        ValueError: If the template is malformed
+    """
+    return {
+        field_name.partition(".")[0].partition("[")[0]
+        for _, field_name, _, _ in Formatter().parse(template)
+        if field_name is not None
+    }
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Callable[[Mapping[str, Any]], str]:
+    """
+    Parse a prompt template once into a function that fills it in.
+
+    Templates with only plain named placeholders are rendered by joining
+    the pre-split literal parts; anything else (format specs, conversions,
+    attribute fields) falls back to str.format_map. Templates with unknown
+    placeholders render the default prompt instead.
+
+    Args:
+        template: Prompt template with str.format placeholders
+
+    Returns:
+        Callable[[Mapping[str, Any]], str]: Function taking the placeholder values
+    """
+    unknown_fields = _get_template_fields(template) - TEMPLATE_FIELDS
+    if unknown_fields:
+        logger.warning(
+            f"Invalid placeholders in prompt template: {sorted(unknown_fields)}"
+        )
+        return _compile_template(DEFAULT_PROMPT_TEMPLATE)
+
+    parts = list(Formatter().parse(template))
+    if any(
+        field_name is not None
+        and (format_spec or conversion or not field_name.isidentifier())
+        for _, field_name, format_spec, conversion in parts
+    ):
+        return template.format_map
+
+    def render(values: Mapping[str, Any]) -> str:
+        return "".join(
+            literal if field_name is None else literal + str(values[field_name])
+            for literal, field_name, _, _ in parts
+        )
+
+    return render
+
 
 class HumanNodeHandler(BaseNodeHandler):
     """
@@ -25,6 +94,8 @@ class HumanNodeHandler(BaseNodeHandler):
     human assistance requests.
     """
 
+    __slots__ = ()
+
     def create_handler(self, node: GraphNode) -> Callable:
         """
         Create a LangGraph node handler function for human nodes.
@@ -44,7 +115,7 @@ class HumanNodeHandler(BaseNodeHandler):
                 # Log execution start
                 self.log_node_execution(
                     node.node_id,
-                    "running",
+                    STATUS_RUNNING,
                     timeout_seconds=node_config.get("timeout_seconds", 3600),
                 )
 
@@ -60,7 +131,7 @@ class HumanNodeHandler(BaseNodeHandler):
                 # Log successful execution
                 self.log_node_execution(
                     node.node_id,
-                    "completed",
+                    STATUS_COMPLETED,
                     response_length=len(human_response["data"]),
                 )
 
@@ -68,7 +139,9 @@ class HumanNodeHandler(BaseNodeHandler):
 
             except Exception as e:
                 error_msg = f"Human node execution failed: {str(e)}"
-                self.log_node_execution(node.node_id, "failed", error_message=error_msg)
+                self.log_node_execution(
+                    node.node_id, STATUS_FAILED, error_message=error_msg
+                )
                 return self.create_error_command(error_msg)
 
         return human_handler
@@ -97,6 +170,19 @@ class HumanNodeHandler(BaseNodeHandler):
                 logger.warning("prompt_template must be a string")
                 return False
 
+            # Reject unknown placeholders
+            try:
+                field_names = _get_template_fields(prompt)
+            except ValueError as e:
+                logger.warning(f"Invalid prompt_template: {e}")
+                return False
+            if not field_names <= TEMPLATE_FIELDS:
+                logger.warning(
+                    f"Invalid placeholders in prompt_template: "
+                    f"{sorted(field_names - TEMPLATE_FIELDS)}"
+                )
+                return False
+
         return True
 
     def _prepare_human_query(
@@ -112,27 +198,21 @@ class HumanNodeHandler(BaseNodeHandler):
         Returns:
             str: Formatted query for human assistance
         """
-        prompt_template = node_config.get(
-            "prompt_template", "Please provide assistance for: {query}"
-        )
+        prompt_template = node_config.get("prompt_template", DEFAULT_PROMPT_TEMPLATE)
 
         # Extract context from state
         context = self._extract_context(state)
 
-        # Format the prompt
-        try:
-            query = prompt_template.format(
-                query=context,
-                session_id=state.session_id or "unknown",
-                execution_id=(
-                    str(state.execution_id) if state.execution_id else "unknown"
-                ),
-            )
-        except KeyError as e:
-            logger.warning(f"Invalid placeholder in prompt template: {e}")
-            query = f"Please provide assistance for: {context}"
-
-        return query
+        # Format the prompt; unknown placeholders fall back to the default
+        session_id = state.get("session_id")
+        execution_id = state.get("execution_id")
+        return _compile_template(prompt_template)(
+            {
+                "query": context,
+                "session_id": session_id or "unknown",
+                "execution_id": str(execution_id) if execution_id else "unknown",
+            }
+        )
 
     def _extract_context(self, state: DynamicState) -> str:
         """
@@ -144,28 +224,36 @@ class HumanNodeHandler(BaseNodeHandler):
         Returns:
             str: Context information
         """
-        context_parts = []
+        return (
+            " | ".join(self._iter_context_parts(state))
+            or "No specific context available"
+        )
+
+    def _iter_context_parts(self, state: DynamicState) -> Iterator[str]:
+        """
+        Yield the pieces of context available in the current state.
+
+        Args:
+            state: Current execution state
 
+        Yields:
+            str: Context part
+        """
         # Add last message content
-        if state.messages:
-            last_message = state.messages[-1]
-            content = getattr(last_message, "content", "")
+        messages = state.get("messages")
+        if messages:
+            content = getattr(messages[-1], "content", "")
             if content:
-                context_parts.append(f"Last message: {content}")
+                yield f"Last message: {content}"
 
         # Add current node information
-        if state.current_node_id:
-            context_parts.append(f"Current node: {state.current_node_id}")
+        current_node_id = state.get("current_node_id")
+        if current_node_id:
+            yield f"Current node: {current_node_id}"
 
         # Add execution metadata
-        if state.graph_metadata:
-            metadata_str = ", ".join(
-                [f"{k}: {v}" for k, v in state.graph_metadata.items()]
+        graph_metadata = state.get("graph_metadata")
+        if graph_metadata:
+            yield "Metadata: " + ", ".join(
+                f"{k}: {v}" for k, v in graph_metadata.items()
             )
-            context_parts.append(f"Metadata: {metadata_str}")
-
-        return (
-            " | ".join(context_parts)
-            if context_parts
-            else "No specific context available"
-        )
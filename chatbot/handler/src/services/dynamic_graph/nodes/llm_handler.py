@@ -6,7 +6,8 @@ models, prompts, and parameters.
 """
 
 import logging
-from typing import Dict, Any, Callable, List
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional
 from langgraph.types import Command
 from langchain_core.runnables import RunnableConfig
 from langchain_core.messages import SystemMessage
@@ -14,11 +15,51 @@ from langchain_aws import ChatBedrockConverse
 
 from database.models import GraphNode
 from .base_handler import BaseNodeHandler
+from ..execution.tracker import STATUS_RUNNING, STATUS_COMPLETED, STATUS_FAILED
 from ..engine.state_manager import DynamicState
-from config.config import config
+from config.config import config as app_config
 
 logger = logging.getLogger(__name__)
 
+# Defaults for custom LLM parameters missing from a node's configuration
+LLM_DEFAULTS = {
+    "temperature": 0.7,
+    "max_tokens": 1000,
+    "top_p": 1.0,
+    "frequency_penalty": 0.0,
+    "presence_penalty": 0.0,
+}
+
+
+@lru_cache(maxsize=32)
+def _build_llm(
+    model_id: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    region_name: str,
+) -> ChatBedrockConverse:
+    """
+    Create a Bedrock chat model, reusing the instance for identical settings.
+
+    Building the client resolves boto3 configuration and endpoints, so
+    instances are shared across node invocations instead of rebuilt.
+
+    Args:
+        model_id: Bedrock model ID
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate, or None for the model default
+        region_name: AWS region
+
+    Returns:
+        ChatBedrockConverse: Configured LLM instance
+    """
+    return ChatBedrockConverse(
+        model=model_id,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        region_name=region_name,
+    )
+
 
 class LLMNodeHandler(BaseNodeHandler):
     """
@@ -28,6 +69,8 @@ class LLMNodeHandler(BaseNodeHandler):
     and other LLM parameters.
     """
 
+    __slots__ = ()
+
     def create_handler(self, node: GraphNode) -> Callable:
         """
         Create a LangGraph node handler function for LLM nodes.
@@ -39,50 +82,54 @@ class LLMNodeHandler(BaseNodeHandler):
             Callable: Function that can be used as a LangGraph node
         """
 
+        # Resolve the LLM once; it is fixed for the compiled graph.
+        # Use the same configuration as the working static graph.
+        try:
+            model = _build_llm(
+                app_config.AWS_BEDROCK_MODEL_ID, 0, None, app_config.AWS_REGION
+            )
+            model_error = None
+        except Exception as e:
+            model = None
+            model_error = str(e)
+
         def llm_handler(state: DynamicState, config: RunnableConfig) -> Command:
+            execution_id = state.get("execution_id")
             try:
+                if model_error:
+                    raise ValueError(model_error)
+
+                messages = state["messages"]
+
                 # Log execution start
                 self.log_node_execution(
                     node.node_id,
-                    "running",
-                    execution_id=state.get("execution_id"),
-                    input_tokens=len(state.get("messages", [])),
-                )
-
-                # Create LLM with same configuration as working static graph
-                from config.config import config as app_config
-
-                model = ChatBedrockConverse(
-                    model=app_config.AWS_BEDROCK_MODEL_ID,
-                    temperature=0,
-                    max_tokens=None,
-                    region_name=app_config.AWS_REGION,
+                    STATUS_RUNNING,
+                    execution_id=execution_id,
+                    input_tokens=len(messages),
                 )
 
                 # Execute LLM with state messages directly
-                response = model.invoke(state["messages"], config)
+                response = model.invoke(messages, config)
 
                 # Log successful execution
+                content = getattr(response, "content", None)
                 self.log_node_execution(
                     node.node_id,
-                    "completed",
-                    execution_id=state.get("execution_id"),
-                    output_tokens=(
-                        len(response.content) if hasattr(response, "content") else 0
-                    ),
+                    STATUS_COMPLETED,
+                    execution_id=execution_id,
+                    output_tokens=len(content) if content else 0,
                 )
 
-                # Append the response to existing messages
-                current_messages = state.get("messages", [])
-                new_messages = current_messages + [response]
-                return Command(update={"messages": new_messages})
+                # The add_messages reducer appends the response to existing messages
+                return Command(update={"messages": [response]})
 
             except Exception as e:
                 error_msg = f"LLM node execution failed: {str(e)}"
                 self.log_node_execution(
                     node.node_id,
-                    "failed",
-                    execution_id=state.get("execution_id"),
+                    STATUS_FAILED,
+                    execution_id=execution_id,
                     error_message=error_msg,
                 )
                 return self.create_error_command(error_msg)
@@ -133,22 +180,21 @@ class LLMNodeHandler(BaseNodeHandler):
             ChatBedrockConverse: Configured LLM instance
         """
         # Extract configuration
-        model_id = node_config.get("model", config.AWS_BEDROCK_MODEL_ID)
-        temperature = node_config.get("temperature", 0.7)
-        max_tokens = node_config.get("max_tokens", 1000)
-        top_p = node_config.get("top_p", 1.0)
-        frequency_penalty = node_config.get("frequency_penalty", 0.0)
-        presence_penalty = node_config.get("presence_penalty", 0.0)
-
-        # Create LLM with custom parameters
-        llm = ChatBedrockConverse(
-            model=model_id,
-            temperature=temperature,
-            max_tokens=max_tokens if max_tokens > 0 else None,
-            region_name=config.AWS_REGION,
+        llm_config = {**LLM_DEFAULTS, **node_config}
+        model_id = llm_config.get("model", app_config.AWS_BEDROCK_MODEL_ID)
+        temperature = llm_config["temperature"]
+        max_tokens = llm_config["max_tokens"]
+
+        # Get LLM with custom parameters
+        llm = _build_llm(
+            model_id,
+            temperature,
+            max_tokens if max_tokens > 0 else None,
+            app_config.AWS_REGION,
         )
 
-        logger.debug(f"Created LLM with model={model_id}, temp={temperature}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Created LLM with model={model_id}, temp={temperature}")
         return llm
 
     def _prepare_messages(self, messages: List, node_config: Dict[str, Any]) -> List:
@@ -168,7 +214,10 @@ class LLMNodeHandler(BaseNodeHandler):
         system_message = SystemMessage(content=system_prompt)
 
         # Prepend system message to existing messages
-        prepared_messages = [system_message] + messages
+        prepared_messages = [system_message, *messages]
 
-        logger.debug(f"Prepared {len(prepared_messages)} messages with system prompt")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Prepared {len(prepared_messages)} messages with system prompt"
+            )
         return prepared_messages
@@ -12,10 +12,15 @@ from langgraph.types import Command
 
 from database.models import GraphNode
 from .base_handler import BaseNodeHandler
+from ..execution.tracker import STATUS_RUNNING, STATUS_COMPLETED, STATUS_FAILED
 from ..engine.state_manager import DynamicState
 
 logger = logging.getLogger(__name__)
 
+# Commands are frozen, so every start/end visit can return the same one
+START_RESULT = Command(update={})  # No state changes
+END_RESULT = Command(update={"is_last_step": True})
+
 
 class StartEndNodeHandler(BaseNodeHandler):
     """
@@ -25,6 +30,8 @@ class StartEndNodeHandler(BaseNodeHandler):
     terminate the execution.
     """
 
+    __slots__ = ()
+
     def create_handler(self, node: GraphNode) -> Callable:
         """
         Create a LangGraph node handler function for start/end nodes.
@@ -36,61 +43,71 @@ class StartEndNodeHandler(BaseNodeHandler):
             Callable: Function that can be used as a LangGraph node
         """
 
-        def start_end_handler(state: DynamicState) -> Command:
-            try:
-                node_type = node.node_type
-
-                logger.info(
-                    f"Start/End Handler executing for node {node.node_id} (type: {node_type})"
+        node_type = node.node_type
+
+        # Resolve the node's behaviour once; its type is fixed
+        if node_type == "start":
+            # Start node - just pass through
+            result = START_RESULT
+            message = "Start node executed"
+        elif node_type == "end":
+            # End node - mark as last step
+            result = END_RESULT
+            message = "End node executed"
+        else:
+            error_msg = f"Unknown node type: {node_type}"
+
+            def unknown_node_handler(state: DynamicState) -> Command:
+                execution_id = state.get("execution_id")
+                self.log_node_execution(
+                    node.node_id,
+                    STATUS_RUNNING,
+                    execution_id=execution_id,
+                    node_type=node_type,
                 )
-                logger.info(
-                    f"Current state messages: {len(state.get('messages', [])) if state.get('messages') else 0}"
+                self.log_node_execution(
+                    node.node_id,
+                    STATUS_FAILED,
+                    execution_id=execution_id,
+                    error_message=error_msg,
                 )
+                return self.create_error_command(error_msg)
+
+            return unknown_node_handler
+
+        def start_end_handler(state: DynamicState) -> Command:
+            execution_id = state.get("execution_id")
+            try:
+                if logger.isEnabledFor(logging.INFO):
+                    messages = state.get("messages")
+                    logger.info(
+                        f"Start/End Handler executing for node {node.node_id} (type: {node_type})"
+                    )
+                    logger.info(
+                        f"Current state messages: {len(messages) if messages else 0}"
+                    )
 
                 # Log execution
                 self.log_node_execution(
                     node.node_id,
-                    "running",
-                    execution_id=state.get("execution_id"),
+                    STATUS_RUNNING,
+                    execution_id=execution_id,
                     node_type=node_type,
                 )
-
-                if node_type == "start":
-                    # Start node - just pass through
-                    self.log_node_execution(
-                        node.node_id,
-                        "completed",
-                        execution_id=state.get("execution_id"),
-                        message="Start node executed",
-                    )
-                    return Command(update={})  # No state changes
-
-                elif node_type == "end":
-                    # End node - mark as last step
-                    self.log_node_execution(
-                        node.node_id,
-                        "completed",
-                        execution_id=state.get("execution_id"),
-                        message="End node executed",
-                    )
-                    return Command(update={"is_last_step": True})
-
-                else:
-                    error_msg = f"Unknown node type: {node_type}"
-                    self.log_node_execution(
-                        node.node_id,
-                        "failed",
-                        execution_id=state.get("execution_id"),
-                        error_message=error_msg,
-                    )
-                    return self.create_error_command(error_msg)
+                self.log_node_execution(
+                    node.node_id,
+                    STATUS_COMPLETED,
+                    execution_id=execution_id,
+                    message=message,
+                )
+                return result
 
             except Exception as e:
                 error_msg = f"Start/End node execution failed: {str(e)}"
                 self.log_node_execution(
                     node.node_id,
-                    "failed",
-                    execution_id=state.get("execution_id"),
+                    STATUS_FAILED,
+                    execution_id=execution_id,
                     error_message=error_msg,
                 )
                 return self.create_error_command(error_msg)
@@ -5,19 +5,34 @@ Handles tool nodes in the dynamic graph system with configurable
 tool execution and error handling.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Callable, List
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Any, Callable, FrozenSet, List, Optional, Sequence, Tuple
+import orjson
 from langgraph.types import Command
 from langchain_core.messages import ToolMessage
 from langchain_core.tools import BaseTool
 
 from database.models import GraphNode
 from .base_handler import BaseNodeHandler
+from ..execution.tracker import STATUS_RUNNING, STATUS_COMPLETED, STATUS_FAILED
 from ..engine.state_manager import DynamicState
 from ..utils.tool_converter import ToolConverter
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of memoized tool results kept per process
+MAX_MEMOIZED_RESULTS = 1024
+
+# Formatted results of memoizable tools with the time they were stored,
+# keyed by session, tool name and arguments
+_memo: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+_memo_lock = Lock()
+
 
 class ToolNodeHandler(BaseNodeHandler):
     """
@@ -27,6 +42,8 @@ class ToolNodeHandler(BaseNodeHandler):
     and error recovery.
     """
 
+    __slots__ = ()
+
     def create_handler(self, node: GraphNode) -> Callable:
         """
         Create a LangGraph node handler function for tool nodes.
@@ -38,44 +55,55 @@ class ToolNodeHandler(BaseNodeHandler):
             Callable: Function that can be used as a LangGraph node
         """
 
-        def tool_handler(state: DynamicState) -> Command:
+        # LangChain tools of the node, kept until its tools change
+        tools_version = None
+        tools_by_name: Dict[str, BaseTool] = {}
+
+        async def tool_handler(state: DynamicState) -> Command:
+            nonlocal tools_version, tools_by_name
             try:
                 # Get node configuration
                 node_config = self.get_node_config(node)
 
+                # Tool calls requested by the last message
+                messages = state.get("messages")
+                last_message = messages[-1] if messages else None
+                tool_calls = getattr(last_message, "tool_calls", None) or ()
+
                 # Log execution start
                 self.log_node_execution(
-                    node.node_id,
-                    "running",
-                    input_tools=(
-                        len(state.messages[-1].tool_calls)
-                        if state.messages and hasattr(state.messages[-1], "tool_calls")
-                        else 0
-                    ),
+                    node.node_id, STATUS_RUNNING, input_tools=len(tool_calls)
                 )
 
-                # Get tools for this node
-                available_tools = self.config_manager.get_node_tools(node)
+                # Get tools for this node (a database query, kept off the loop)
+                available_tools = await asyncio.to_thread(
+                    self.config_manager.get_node_tools, node
+                )
 
-                # Convert to LangChain tools
-                langchain_tools = ToolConverter.convert_tools_list(available_tools)
-                tools_by_name = {tool.name: tool for tool in langchain_tools}
+                # Convert to LangChain tools only when the node's tools changed
+                version = self.config_manager.get_tools_version(available_tools)
+                if version != tools_version:
+                    langchain_tools = ToolConverter.convert_tools_list(available_tools)
+                    tools_by_name = {tool.name: tool for tool in langchain_tools}
+                    tools_version = version
 
-                # Execute tools
-                outputs = self._execute_tools(
-                    state.messages[-1], tools_by_name, node_config
+                # Execute tools; memoized results are only shared within a session
+                outputs = await self._execute_tools(
+                    tool_calls, tools_by_name, node_config, state.get("session_id")
                 )
 
                 # Log successful execution
                 self.log_node_execution(
-                    node.node_id, "completed", output_tools=len(outputs)
+                    node.node_id, STATUS_COMPLETED, output_tools=len(outputs)
                 )
 
                 return Command(update={"messages": outputs})
 
             except Exception as e:
                 error_msg = f"Tool node execution failed: {str(e)}"
-                self.log_node_execution(node.node_id, "failed", error_message=error_msg)
+                self.log_node_execution(
+                    node.node_id, STATUS_FAILED, error_message=error_msg
+                )
                 return self.create_error_command(error_msg)
 
         return tool_handler
@@ -104,99 +132,291 @@ class ToolNodeHandler(BaseNodeHandler):
                 logger.warning(f"Invalid retry_attempts value: {retries}")
                 return False
 
+        # Validate retry backoff cap
+        if "max_backoff_seconds" in config:
+            max_backoff = config["max_backoff_seconds"]
+            if not isinstance(max_backoff, int) or max_backoff < 0:
+                logger.warning(f"Invalid max_backoff_seconds value: {max_backoff}")
+                return False
+
+        # Validate tool call concurrency
+        if "max_concurrency" in config:
+            max_concurrency = config["max_concurrency"]
+            if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+                logger.warning(f"Invalid max_concurrency value: {max_concurrency}")
+                return False
+
+        # Validate memoized result lifetime
+        if "memo_ttl_seconds" in config:
+            memo_ttl = config["memo_ttl_seconds"]
+            if not isinstance(memo_ttl, int) or memo_ttl <= 0:
+                logger.warning(f"Invalid memo_ttl_seconds value: {memo_ttl}")
+                return False
+
+        # Validate memoized tool names
+        if "memoize_tools" in config:
+            memoize_tools = config["memoize_tools"]
+            if not isinstance(memoize_tools, list) or not all(
+                isinstance(tool_name, str) for tool_name in memoize_tools
+            ):
+                logger.warning("memoize_tools must be a list of tool names")
+                return False
+
         return True
 
-    def _execute_tools(
+    async def _execute_tools(
         self,
-        last_message,
+        tool_calls: Sequence[Dict[str, Any]],
         tools_by_name: Dict[str, BaseTool],
         node_config: Dict[str, Any],
+        session_id: Optional[str] = None,
     ) -> List[ToolMessage]:
         """
-        Execute tools based on the last message's tool calls.
+        Execute the tool calls of the last message.
+
+        With parallel_execution, up to max_concurrency tool calls run at
+        once; otherwise they run one at a time. Results keep the order of
+        the calls. Without continue_on_error, the first failure cancels the
+        calls that have not finished and is raised.
 
         Args:
-            last_message: Last message with tool calls
+            tool_calls: Tool calls from the last message
             tools_by_name: Dictionary of available tools
             node_config: Node configuration
+            session_id: Session the memoized results are scoped to; without
+                one, no results are memoized
 
         Returns:
             List[ToolMessage]: Tool execution results
         """
-        outputs = []
-
-        if not hasattr(last_message, "tool_calls") or not last_message.tool_calls:
+        if not tool_calls:
             logger.warning("No tool calls found in last message")
-            return outputs
+            return []
 
         timeout_seconds = node_config.get("timeout_seconds", 300)
         retry_attempts = node_config.get("retry_attempts", 3)
+        max_backoff_seconds = node_config.get("max_backoff_seconds", 30)
         continue_on_error = node_config.get("continue_on_error", True)
+        memoize_tools = (
+            frozenset(node_config.get("memoize_tools") or ())
+            if session_id
+            else frozenset()
+        )
+        memo_ttl_seconds = node_config.get("memo_ttl_seconds", 300)
+        concurrency = (
+            max(1, node_config.get("max_concurrency", 8))
+            if node_config.get("parallel_execution", False)
+            else 1
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        calls = [
+            self._execute_tool_call(
+                tool_call,
+                tools_by_name,
+                retry_attempts,
+                timeout_seconds,
+                max_backoff_seconds,
+                continue_on_error,
+                memoize_tools,
+                session_id,
+                memo_ttl_seconds,
+                semaphore,
+            )
+            for tool_call in tool_calls
+        ]
+
+        # Failures come back as error messages, so every call runs
+        if continue_on_error:
+            return await asyncio.gather(*calls)
+
+        # Otherwise the first failing call cancels the calls still pending
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(call) for call in calls]
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0]
 
-        for tool_call in last_message.tool_calls:
-            tool_name = tool_call["name"]
-            tool_args = tool_call["args"]
+        return [task.result() for task in tasks]
 
-            logger.debug(f"Executing tool: {tool_name} with args: {tool_args}")
+    async def _execute_tool_call(
+        self,
+        tool_call: Dict[str, Any],
+        tools_by_name: Dict[str, BaseTool],
+        retry_attempts: int,
+        timeout_seconds: int,
+        max_backoff_seconds: int,
+        continue_on_error: bool,
+        memoize_tools: FrozenSet[str],
+        session_id: Optional[str],
+        memo_ttl_seconds: int,
+        semaphore: asyncio.Semaphore,
+    ) -> ToolMessage:
+        """
+        Execute a single tool call.
 
-            try:
-                # Get tool
-                if tool_name not in tools_by_name:
-                    error_msg = f"Tool not found: {tool_name}"
-                    logger.error(error_msg)
-                    if not continue_on_error:
-                        raise ValueError(error_msg)
-
-                    outputs.append(
-                        ToolMessage(
-                            content=f"Error: {error_msg}",
-                            name=tool_name,
-                            tool_call_id=tool_call["id"],
-                        )
-                    )
-                    continue
+        Args:
+            tool_call: Tool call from the last message
+            tools_by_name: Dictionary of available tools
+            retry_attempts: Maximum number of retry attempts
+            timeout_seconds: Timeout in seconds
+            max_backoff_seconds: Maximum wait between retries in seconds
+            continue_on_error: Whether to return failures as error messages
+            memoize_tools: Names of tools whose results may be reused
+            session_id: Session the memoized results are scoped to
+            memo_ttl_seconds: How long a memoized result may be reused
+            semaphore: Limits how many tools of the node run at once
 
-                tool = tools_by_name[tool_name]
+        Returns:
+            ToolMessage: Tool execution result
+        """
+        tool_name = tool_call["name"]
+        tool_args = tool_call["args"]
 
-                # Execute tool with retry logic
-                tool_result = self._execute_tool_with_retry(
-                    tool, tool_args, retry_attempts, timeout_seconds
-                )
+        # Arguments can embed large payloads; only serialize them when logged
+        if logger.isEnabledFor(logging.DEBUG):
+            args_json = orjson.dumps(tool_args, default=str).decode()
+            logger.debug(f"Executing tool: {tool_name} with args: {args_json}")
 
-                # Format result
-                formatted_result = self._format_tool_result(tool_call, tool_result)
+        try:
+            # Get tool
+            if tool_name not in tools_by_name:
+                error_msg = f"Tool not found: {tool_name}"
+                logger.error(error_msg)
+                if not continue_on_error:
+                    raise ValueError(error_msg)
+
+                return ToolMessage(
+                    content=f"Error: {error_msg}",
+                    name=tool_name,
+                    tool_call_id=tool_call["id"],
+                )
 
-                outputs.append(
-                    ToolMessage(
-                        content=formatted_result,
+            tool = tools_by_name[tool_name]
+
+            # Reuse the result of an identical earlier call to an idempotent tool
+            memo_key = None
+            if tool_name in memoize_tools:
+                memo_key = self._get_memo_key(session_id, tool_name, tool_args)
+                cached_result = self._get_memoized(memo_key, memo_ttl_seconds)
+                if cached_result is not None:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Using memoized result for tool: {tool_name}")
+                    return ToolMessage(
+                        content=cached_result,
                         name=tool_name,
                         tool_call_id=tool_call["id"],
                     )
+
+            # Execute tool with retry logic
+            async with semaphore:
+                tool_result = await self._execute_tool_with_retry(
+                    tool,
+                    tool_args,
+                    retry_attempts,
+                    timeout_seconds,
+                    max_backoff_seconds,
                 )
 
-            except Exception as e:
-                error_msg = f"Failed to execute tool {tool_name}: {str(e)}"
-                logger.error(error_msg)
+            # Format result
+            formatted_result = self._format_tool_result(tool_call, tool_result)
 
-                if not continue_on_error:
-                    raise
+            # Only successful results are memoized
+            if memo_key is not None:
+                self._memoize(memo_key, formatted_result)
 
-                outputs.append(
-                    ToolMessage(
-                        content=f"Error: {error_msg}",
-                        name=tool_name,
-                        tool_call_id=tool_call["id"],
-                    )
-                )
+            return ToolMessage(
+                content=formatted_result,
+                name=tool_name,
+                tool_call_id=tool_call["id"],
+            )
+
+        except Exception as e:
+            error_msg = f"Failed to execute tool {tool_name}: {str(e)}"
+            logger.error(error_msg)
+
+            if not continue_on_error:
+                raise
+
+            return ToolMessage(
+                content=f"Error: {error_msg}",
+                name=tool_name,
+                tool_call_id=tool_call["id"],
+            )
+
+    @staticmethod
+    def _get_memo_key(
+        session_id: str, tool_name: str, tool_args: Dict[str, Any]
+    ) -> str:
+        """
+        Generate the memoization key for a tool call.
+
+        Args:
+            session_id: Session the result is scoped to
+            tool_name: Tool name
+            tool_args: Tool arguments
+
+        Returns:
+            str: Memoization key
+        """
+        args_data = orjson.dumps(tool_args, option=orjson.OPT_SORT_KEYS, default=str)
+        return f"{session_id}:{tool_name}:{hashlib.sha256(args_data).hexdigest()}"
+
+    @staticmethod
+    def _get_memoized(memo_key: str, ttl_seconds: int) -> Optional[str]:
+        """
+        Get a memoized tool result that has not expired.
+
+        Args:
+            memo_key: Memoization key
+            ttl_seconds: How long a memoized result may be reused
+
+        Returns:
+            Optional[str]: Formatted tool result or None
+        """
+        with _memo_lock:
+            entry = _memo.get(memo_key)
+            if entry is None:
+                return None
+
+            stored_at, result = entry
+            if time.monotonic() - stored_at > ttl_seconds:
+                del _memo[memo_key]
+                return None
 
-        return outputs
+            _memo.move_to_end(memo_key)
+            return result
+
+    @staticmethod
+    def _memoize(memo_key: str, result: str) -> None:
+        """
+        Store a tool result, evicting the least recently used one when full.
 
-    def _execute_tool_with_retry(
+        Args:
+            memo_key: Memoization key
+            result: Formatted tool result
+        """
+        with _memo_lock:
+            _memo[memo_key] = (time.monotonic(), result)
+            _memo.move_to_end(memo_key)
+            if len(_memo) > MAX_MEMOIZED_RESULTS:
+                _memo.popitem(last=False)
+
+    @staticmethod
+    def clear_memo_cache() -> None:
+        """
+        Clear all memoized tool results.
+        """
+        with _memo_lock:
+            _memo.clear()
+
+    async def _execute_tool_with_retry(
         self,
         tool: BaseTool,
         tool_args: Dict[str, Any],
         max_retries: int,
         timeout_seconds: int,
+        max_backoff_seconds: int = 30,
     ) -> Any:
         """
         Execute a tool with retry logic and timeout.
@@ -206,6 +426,7 @@ class ToolNodeHandler(BaseNodeHandler):
             tool_args: Tool arguments
             max_retries: Maximum number of retry attempts
             timeout_seconds: Timeout in seconds
+            max_backoff_seconds: Maximum wait between retries in seconds
 
         Returns:
             Any: Tool execution result
@@ -214,20 +435,21 @@ class ToolNodeHandler(BaseNodeHandler):
 
         for attempt in range(max_retries + 1):
             try:
-                # Execute tool with timeout
+                # Execute tool with timeout, without blocking the event loop
                 if hasattr(tool, "ainvoke"):
                     # Async tool
-                    loop = asyncio.get_event_loop()
-                    result = loop.run_until_complete(
-                        asyncio.wait_for(
-                            tool.ainvoke(tool_args), timeout=timeout_seconds
-                        )
+                    result = await asyncio.wait_for(
+                        tool.ainvoke(tool_args), timeout=timeout_seconds
                     )
                 else:
                     # Sync tool
-                    result = tool.invoke(tool_args)
+                    result = await asyncio.wait_for(
+                        asyncio.to_thread(tool.invoke, tool_args),
+                        timeout=timeout_seconds,
+                    )
 
-                logger.debug(f"Tool executed successfully on attempt {attempt + 1}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Tool executed successfully on attempt {attempt + 1}")
                 return result
 
             except asyncio.TimeoutError:
@@ -240,11 +462,12 @@ class ToolNodeHandler(BaseNodeHandler):
                 last_exception = e
                 logger.warning(f"Tool execution failed on attempt {attempt + 1}: {e}")
 
-                if attempt < max_retries:
-                    # Wait before retry (exponential backoff)
-                    wait_time = 2**attempt
+            if attempt < max_retries:
+                # Wait before retry (capped exponential backoff)
+                wait_time = min(2**attempt, max_backoff_seconds)
+                if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(f"Waiting {wait_time} seconds before retry")
-                    asyncio.sleep(wait_time)
+                await asyncio.sleep(wait_time)
 
         # All retries failed
         raise last_exception or Exception("Tool execution failed")
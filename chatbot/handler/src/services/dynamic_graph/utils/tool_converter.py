@@ -5,14 +5,85 @@ Converts database AvailableTool models to LangChain tools.
 """
 
 import logging
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, create_model
+import orjson
 
 from database.models import AvailableTool
 
 logger = logging.getLogger(__name__)
 
+# Python types for JSON schema types
+JSON_SCHEMA_TYPES: Dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+@lru_cache(maxsize=4096)
+def _build_tool(
+    name: str, description: Optional[str], display_name: str, schema_json: bytes
+) -> StructuredTool:
+    """
+    Build a LangChain tool, reusing it while the tool's definition is unchanged.
+
+    StructuredTool instances are not modified after construction, so one
+    instance can serve every graph execution.
+
+    Args:
+        name: Tool name
+        description: Tool description
+        display_name: Tool display name
+        schema_json: JSON of the tool's input schema, in its original key order
+
+    Returns:
+        StructuredTool: LangChain tool
+    """
+    # Create Pydantic model from schema
+    args_schema = _build_args_schema(schema_json)
+
+    # Create tool function
+    def tool_function(**kwargs):
+        # This is a placeholder - in a real implementation,
+        # you would route to the actual tool implementation
+        logger.info(f"Executing tool {name} with args: {kwargs}")
+        return f"Tool {name} executed with args: {kwargs}"
+
+    # Create StructuredTool
+    return StructuredTool.from_function(
+        func=tool_function,
+        name=name,
+        description=description or f"Tool: {display_name}",
+        args_schema=args_schema,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _build_args_schema(schema_json: bytes) -> BaseModel:
+    """
+    Build a Pydantic args model once per input schema.
+
+    Tools with identical schemas (e.g. a single "query" string) share one
+    model, so its validator is compiled only once. The model name is not
+    exposed to the LLM; LangChain derives the tool call schema from the
+    tool's own name.
+
+    Args:
+        schema_json: JSON of the tool's input schema, in its original key order
+
+    Returns:
+        BaseModel: Pydantic model class
+    """
+    return ToolConverter._create_pydantic_model_from_schema(
+        "tool", orjson.loads(schema_json)
+    )
+
 
 class ToolConverter:
     """
@@ -31,31 +102,14 @@ class ToolConverter:
             StructuredTool: LangChain tool
         """
         try:
-            # Extract schema information
-            tool_schema = tool.schema
+            # Extract schema information in a hashable form. Keys keep the
+            # author's order, since the args model lists properties in it.
+            schema_json = orjson.dumps(tool.schema)
 
-            # Create Pydantic model from schema
-            args_schema = ToolConverter._create_pydantic_model_from_schema(
-                tool.name, tool_schema
+            return _build_tool(
+                tool.name, tool.description, tool.display_name, schema_json
             )
 
-            # Create tool function
-            def tool_function(**kwargs):
-                # This is a placeholder - in a real implementation,
-                # you would route to the actual tool implementation
-                logger.info(f"Executing tool {tool.name} with args: {kwargs}")
-                return f"Tool {tool.name} executed with args: {kwargs}"
-
-            # Create StructuredTool
-            langchain_tool = StructuredTool.from_function(
-                func=tool_function,
-                name=tool.name,
-                description=tool.description or f"Tool: {tool.display_name}",
-                args_schema=args_schema,
-            )
-
-            return langchain_tool
-
         except Exception as e:
             logger.error(f"Failed to convert tool {tool.name}: {e}")
             # Return a simple fallback tool
@@ -115,18 +169,26 @@ class ToolConverter:
         Returns:
             Python type
         """
-        schema_type = field_schema.get("type", "string")
-
-        type_mapping = {
-            "string": str,
-            "integer": int,
-            "number": float,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }
-
-        return type_mapping.get(schema_type, str)
+        schema_type = field_schema.get("type")
+
+        # A list of types (e.g. ["string", "null"]) maps to its first non-null type
+        if isinstance(schema_type, list):
+            schema_type = next((t for t in schema_type if t != "null"), "string")
+
+        if schema_type is None:
+            # Unions map to their first non-null alternative
+            for option in field_schema.get("anyOf", ()):
+                if option.get("type") != "null":
+                    return ToolConverter._get_python_type_from_schema(option)
+
+            # Enums map to the type of their values
+            enum_values = field_schema.get("enum")
+            if enum_values and type(enum_values[0]) in JSON_SCHEMA_TYPES.values():
+                return type(enum_values[0])
+
+            return str
+
+        return JSON_SCHEMA_TYPES.get(schema_type, str)
 
     @staticmethod
     def convert_tools_list(tools: List[AvailableTool]) -> List[StructuredTool]:
@@ -1,6 +1,11 @@
+import asyncio
+import hashlib
 import logging
+import os
+import time
+from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 from mcp import ClientSession, StdioServerParameters
@@ -9,6 +14,84 @@ from mcp.client.sse import sse_client
 
 logger = logging.getLogger(__name__)
 
+# How long a server's tool listing is reused before connecting again
+MCP_TOOLS_TTL_SECONDS = float(os.getenv("MCP_TOOLS_TTL", "300"))
+
+# Maximum number of tool listings kept per process
+MAX_CACHED_TOOL_LISTINGS = 128
+
+# Tool listings keyed by connection parameters, with the time they were loaded
+_tools_cache: OrderedDict[str, Tuple[float, List]] = OrderedDict()
+# Loads in progress, so concurrent cold loads share a single handshake
+_pending_loads: Dict[str, asyncio.Task] = {}
+
+
+def _get_tools_cache_key(
+    server_type: str,
+    command: Optional[str],
+    args: Optional[List[str]],
+    url: Optional[str],
+    env: Optional[Dict[str, str]],
+) -> str:
+    """
+    Generate the tool listing cache key for a set of connection parameters.
+
+    Args:
+        server_type: The type of MCP server connection (stdio or sse)
+        command: The command to execute (for stdio type)
+        args: Command arguments (for stdio type)
+        url: The URL of the SSE server (for sse type)
+        env: Environment variables
+
+    Returns:
+        str: Cache key
+    """
+    params = (
+        server_type,
+        command,
+        tuple(args or ()),
+        url,
+        tuple(sorted((env or {}).items())),
+    )
+    return hashlib.blake2b(repr(params).encode()).hexdigest()
+
+
+def _get_cached_tools(cache_key: str) -> Optional[List]:
+    """
+    Get a cached tool listing if it has not expired.
+
+    Args:
+        cache_key: Cache key
+
+    Returns:
+        Optional[List]: Cached tools or None
+    """
+    entry = _tools_cache.get(cache_key)
+    if entry is None:
+        return None
+
+    loaded_at, tools = entry
+    if time.monotonic() - loaded_at > MCP_TOOLS_TTL_SECONDS:
+        del _tools_cache[cache_key]
+        return None
+
+    _tools_cache.move_to_end(cache_key)
+    return list(tools)
+
+
+def _cache_tools(cache_key: str, tools: List) -> None:
+    """
+    Store a tool listing, evicting the least recently used one when full.
+
+    Args:
+        cache_key: Cache key
+        tools: Tools loaded from the MCP server
+    """
+    _tools_cache[cache_key] = (time.monotonic(), list(tools))
+    _tools_cache.move_to_end(cache_key)
+    if len(_tools_cache) > MAX_CACHED_TOOL_LISTINGS:
+        _tools_cache.popitem(last=False)
+
 
 async def _get_tools_from_client_session(
     client_context_manager: Any, timeout_seconds: int = 10
@@ -57,10 +140,14 @@ async def load_mcp_tools(
     url: Optional[str] = None,
     env: Optional[Dict[str, str]] = None,
     timeout_seconds: int = 60,  # Longer default timeout for first-time executions
+    force_refresh: bool = False,
 ) -> List:
     """
     Load tools from an MCP server.
 
+    Listings are cached per connection for MCP_TOOLS_TTL_SECONDS, so
+    repeated loads skip the server handshake.
+
     Args:
         server_type: The type of MCP server connection (stdio or sse)
         command: The command to execute (for stdio type)
@@ -68,6 +155,7 @@ async def load_mcp_tools(
         url: The URL of the SSE server (for sse type)
         env: Environment variables
         timeout_seconds: Timeout in seconds (default: 60 for first-time executions)
+        force_refresh: Ignore any cached listing and query the server
 
     Returns:
         List of available tools from the MCP server
@@ -85,6 +173,64 @@ async def load_mcp_tools(
     if timeout_seconds <= 0:
         raise HTTPException(status_code=400, detail="timeout_seconds must be positive")
 
+    cache_key = _get_tools_cache_key(server_type, command, args, url, env)
+    if not force_refresh:
+        tools = _get_cached_tools(cache_key)
+        if tools is not None:
+            logger.debug(f"Using cached MCP tools from {server_type} server")
+            return tools
+
+    # Join a load of the same server already in progress, or start one
+    load = _pending_loads.get(cache_key)
+    if load is None:
+        load = asyncio.ensure_future(
+            _fetch_mcp_tools(server_type, command, args, url, env, timeout_seconds)
+        )
+        _pending_loads[cache_key] = load
+        load.add_done_callback(lambda finished: _finish_load(cache_key, finished))
+
+    # A caller giving up must not cancel the load other callers wait on
+    return list(await asyncio.shield(load))
+
+
+def _finish_load(cache_key: str, load: asyncio.Task) -> None:
+    """
+    Cache the result of a finished load and forget the load.
+
+    Args:
+        cache_key: Cache key
+        load: Finished load task
+    """
+    _pending_loads.pop(cache_key, None)
+    if not load.cancelled() and load.exception() is None:
+        _cache_tools(cache_key, load.result())
+
+
+async def _fetch_mcp_tools(
+    server_type: str,
+    command: Optional[str],
+    args: Optional[List[str]],
+    url: Optional[str],
+    env: Optional[Dict[str, str]],
+    timeout_seconds: int,
+) -> List:
+    """
+    Connect to an MCP server and list its tools.
+
+    Args:
+        server_type: The type of MCP server connection (stdio or sse)
+        command: The command to execute (for stdio type)
+        args: Command arguments (for stdio type)
+        url: The URL of the SSE server (for sse type)
+        env: Environment variables
+        timeout_seconds: Timeout in seconds
+
+    Returns:
+        List of available tools from the MCP server
+
+    Raises:
+        HTTPException: If there's an error loading the tools
+    """
     try:
         if server_type == "stdio":
             if not command:
@@ -125,20 +271,20 @@ async def load_mcp_tools(
     except HTTPException:
         # Re-raise HTTP exceptions as-is
         raise
+    # Convert other exceptions to HTTP exceptions by their type
+    except asyncio.TimeoutError as e:
+        logger.exception(f"Timeout loading MCP tools from {server_type} server")
+        raise HTTPException(
+            status_code=504, detail=f"Timeout connecting to MCP server: {e}"
+        )
+    except (ConnectionError, OSError) as e:
+        logger.exception(f"Error connecting to {server_type} MCP server: {e}")
+        raise HTTPException(
+            status_code=503, detail=f"Connection error to MCP server: {e}"
+        )
     except Exception as e:
-        logger.exception(f"Error loading MCP tools from {server_type} server: {str(e)}")
-        # Convert other exceptions to HTTP exceptions with appropriate error message
-        error_msg = str(e)
-        if "timeout" in error_msg.lower():
-            raise HTTPException(
-                status_code=504, detail=f"Timeout connecting to MCP server: {error_msg}"
-            )
-        elif "connection" in error_msg.lower():
-            raise HTTPException(
-                status_code=503, detail=f"Connection error to MCP server: {error_msg}"
-            )
-        else:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to load tools from MCP server: {error_msg}",
-            )
+        logger.exception(f"Error loading MCP tools from {server_type} server: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to load tools from MCP server: {e}",
+        )
@@ -1,5 +1,15 @@
-def mask_sensitive(value: str, visible_chars: int = 4) -> str:
-    """Mask sensitive data, showing only the last visible_chars characters."""
+# Longest run of asterisks a masked value can start with
+_STARS = "*" * 64
+
+
+def mask_sensitive(value: str, visible_chars: int = 4, max_mask: int = 8) -> str:
+    """
+    Mask sensitive data, showing only the last visible_chars characters.
+
+    The mask is capped at max_mask asterisks, so long secrets don't reveal
+    their length and masking them doesn't allocate a full-length string.
+    """
     if not value:
         return ""
-    return "*" * (len(value) - visible_chars) + value[-visible_chars:]
+    n = min(max(len(value) - visible_chars, 0), max_mask, len(_STARS))
+    return _STARS[:n] + value[-visible_chars:]